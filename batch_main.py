@@ -0,0 +1,11 @@
+import logging
+
+from config import PROFILES_FILE
+from src.batch_processor import generate_profiles_pages
+from src.data.profile_model import load_profiles
+
+logging.basicConfig(level=logging.INFO)
+
+profiles_files = generate_profiles_pages(load_profiles(PROFILES_FILE))
+for profile_name, saved_files in profiles_files.items():
+    print(f"{profile_name}: {', '.join(saved_files)}")
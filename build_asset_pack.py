@@ -0,0 +1,9 @@
+import logging
+
+from config import ASSET_PACK_FILE
+from src.asset_pack import build_asset_pack
+
+logging.basicConfig(level=logging.INFO)
+
+packed_assets = build_asset_pack()
+print(f"Packed {packed_assets} assets in {ASSET_PACK_FILE}")
@@ -4,7 +4,39 @@ from zoneinfo import ZoneInfo
 DEFAULT_TASK_DELTA_DAYS = 0
 DEFAULT_LOGS_DELTA_DAYS = 0
 OLD_PAGES_FOLDER = "old_pages"
+OLD_PAGES_ARCHIVE_FILE = f"{OLD_PAGES_FOLDER}/old_pages.bin"
+OLD_PAGES_INDEX_FILE = f"{OLD_PAGES_FOLDER}/old_pages_index.json"
+LAYOUTS_FOLDER = "layouts"
 NEW_PAGES_FOLDER = "C:/Users/angel/My Drive/bitacora-prints"
 
 CURRENT_TIMEZONE = ZoneInfo("America/Bogota")
 CURRENT_DATE = datetime.now(CURRENT_TIMEZONE)
+WEATHER_LOCATION = "Quebec City"
+
+PROFILES_FILE = "profiles.json"
+
+CACHE_FOLDER = "cache"
+STATS_CACHE_FILE = f"{CACHE_FOLDER}/stats_cache.json"
+STATS_REFRESH_DAYS = 2
+
+HTTP_POOL_SIZE = 10
+HTTP_MAX_CONCURRENCY = 8
+HTTP_RETRIES = 3
+HTTP_BACKOFF_FACTOR = 0.5
+HTTP_TIMEOUT = 30
+HTTP_KEEPALIVE_SECONDS = 60
+
+RENDER_SERVICE_HOST = "127.0.0.1"
+RENDER_SERVICE_PORT = 8080
+RENDER_SERVICE_WORKERS = 2
+
+ASSET_PACK_FILE = "assets.pack"
+
+LATENCY_BUDGETS = {"tasks": 20, "stats": 10, "journal_url": 10, "weather": 10}
+LAST_KNOWN_DATA_FILE = f"{CACHE_FOLDER}/last_known_data.json"
+
+PRINTED_PAGES_FILE = f"{CACHE_FOLDER}/printed_pages.json"
+
+WATCH_POLL_SECONDS = 30
+WATCH_NOTION_POLL_SECONDS = 300
+WATCH_DEBOUNCE_SECONDS = 20
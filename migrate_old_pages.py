@@ -0,0 +1,14 @@
+import logging
+import os
+
+from config import OLD_PAGES_FOLDER
+from src.page_archive import migrate_old_pages_folder
+
+logging.basicConfig(level=logging.INFO)
+
+verified_files = migrate_old_pages_folder(OLD_PAGES_FOLDER)
+print(f"{len(verified_files)} old pages archived as bilevel and verified")
+
+if verified_files and input("Do you want to delete the verified PNGs? [y/n]: ").lower() == "y":
+    for verified_file in verified_files:
+        os.remove(verified_file)
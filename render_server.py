@@ -0,0 +1,9 @@
+import logging
+import os
+
+from config import RENDER_SERVICE_PORT
+from src.render_service import serve_pages
+
+logging.basicConfig(level=logging.INFO)
+
+serve_pages(port=int(os.getenv("PORT", RENDER_SERVICE_PORT)))
@@ -0,0 +1,177 @@
+import glob
+import hashlib
+import io
+import json
+import logging
+import mmap
+import os
+import struct
+from functools import lru_cache
+
+import numpy as np
+from PIL import Image, ImageFont
+from PIL.Image import Image as ImageType
+
+from config import ASSET_PACK_FILE
+
+asset_pack_magic = b"BITAPACK"
+asset_pack_header = struct.Struct("<8sQ")
+asset_alignment = 4096
+default_asset_patterns = ("designs/*.png", "designs/weather_icons/*.png", "fonts/*.ttf")
+
+
+def _get_raw_mode(image: ImageType) -> str:
+    """Mode in which an image is stored, Pillow can only map some modes without copying.
+
+    RGB images whose channels are all equal are stored as grayscale, a lossless quarter of the RGBX size, and the
+    rest are padded to RGBX.
+    """
+    if image.mode != "RGB":
+        return image.mode
+
+    image_pixels = np.asarray(image)
+    is_grayscale = (np.array_equal(image_pixels[..., 0], image_pixels[..., 1])
+                    and np.array_equal(image_pixels[..., 1], image_pixels[..., 2]))
+    return "L" if is_grayscale else "RGBX"
+
+
+def _get_source_hash(asset_path: str) -> str:
+    with open(asset_path, "rb") as asset_file:
+        return hashlib.blake2b(asset_file.read(), digest_size=16).hexdigest()
+
+
+def build_asset_pack(pack_file: str = ASSET_PACK_FILE, asset_patterns: tuple[str, ...] = default_asset_patterns) -> int:
+    """Pack the templates, weather icons and fonts in a single file.
+
+    Images are stored decoded, as raw pixels in their own mode, and fonts as the original file bytes. The file starts
+    with a header and a JSON index with the position, source size and source content hash of every asset, assets start
+    at page aligned offsets so they can be memory mapped.
+
+    Args:
+        pack_file: Path of the asset pack.
+        asset_patterns: Glob patterns of the assets to pack, relative to the project root.
+
+    Returns:
+        Number of assets packed.
+    """
+    asset_paths = sorted({asset_path.replace(os.sep, "/") for pattern in asset_patterns
+                          for asset_path in glob.glob(pattern)})
+
+    index: dict[str, dict] = {}
+    assets_data: list[bytes] = []
+    data_length = 0
+    for asset_path in asset_paths:
+        logging.info(f"Packing {asset_path}")
+        if asset_path.endswith(".ttf"):
+            with open(asset_path, "rb") as font_file:
+                asset_data = font_file.read()
+            index[asset_path] = {"kind": "font"}
+        else:
+            with Image.open(asset_path) as image:
+                raw_mode = _get_raw_mode(image)
+                asset_data = image.convert(raw_mode).tobytes() if raw_mode != image.mode else image.tobytes()
+                index[asset_path] = {"kind": "image", "mode": image.mode, "raw_mode": raw_mode,
+                                     "width": image.width, "height": image.height}
+
+        index[asset_path].update({"source_size": os.path.getsize(asset_path),
+                                  "source_hash": _get_source_hash(asset_path)})
+
+        padding = -data_length % asset_alignment
+        assets_data.append(b"\0" * padding + asset_data)
+        index[asset_path].update({"offset": data_length + padding, "length": len(asset_data)})
+        data_length += padding + len(asset_data)
+
+    raw_index = json.dumps(index).encode()
+    data_start = asset_pack_header.size + len(raw_index)
+    data_start += -data_start % asset_alignment
+    for asset_entry in index.values():
+        asset_entry["offset"] += data_start
+    raw_index = json.dumps(index).encode()
+
+    with open(pack_file, "wb") as asset_pack:
+        asset_pack.write(asset_pack_header.pack(asset_pack_magic, len(raw_index)))
+        asset_pack.write(raw_index)
+        asset_pack.write(b"\0" * (data_start - asset_pack.tell()))
+        for asset_data in assets_data:
+            asset_pack.write(asset_data)
+
+    return len(index)
+
+
+class AssetPack:
+    """Memory mapped asset pack created with build_asset_pack.
+
+    Images are wrapped without copying, the returned images are read only views of the pack. Assets whose loose file
+    changed since the pack was built are skipped, so edited designs and fonts are read from their files.
+    """
+
+    def __init__(self, pack_file: str = ASSET_PACK_FILE):
+        with open(pack_file, "rb") as asset_pack:
+            self._pack = mmap.mmap(asset_pack.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, index_length = asset_pack_header.unpack_from(self._pack)
+        if magic != asset_pack_magic:
+            raise ValueError(f"{pack_file} is not an asset pack")
+        index_end = asset_pack_header.size + index_length
+        self._index: dict[str, dict] = json.loads(self._pack[asset_pack_header.size:index_end])
+        self._current_assets: dict[str, bool] = {}
+
+    def _get_asset_data(self, asset_entry: dict) -> memoryview:
+        return memoryview(self._pack)[asset_entry["offset"]:asset_entry["offset"] + asset_entry["length"]]
+
+    def _is_asset_current(self, asset_path: str) -> bool:
+        """Check that the content of the loose file of an asset didn't change since it was packed.
+
+        Missing loose files are current, and the loose files are only hashed when their size is the same, once per run.
+        """
+        if asset_path not in self._current_assets:
+            asset_entry = self._index[asset_path]
+            try:
+                is_current = (asset_entry.get("source_size") == os.path.getsize(asset_path)
+                              and asset_entry.get("source_hash") == _get_source_hash(asset_path))
+            except FileNotFoundError:
+                self._current_assets[asset_path] = True
+            else:
+                self._current_assets[asset_path] = is_current
+                if not is_current:
+                    logging.warning(f"{asset_path} changed since the asset pack was built, reading it from its file")
+
+        return self._current_assets[asset_path]
+
+    def has_image(self, image_path: str) -> bool:
+        return self._index.get(image_path, {}).get("kind") == "image" and self._is_asset_current(image_path)
+
+    def has_font(self, font_file: str) -> bool:
+        return self._index.get(font_file, {}).get("kind") == "font" and self._is_asset_current(font_file)
+
+    def get_image(self, image_path: str) -> ImageType:
+        """Wrap the pixels of a packed image, RGB images are returned in their L or RGBX storage mode.
+
+        Args:
+            image_path: Path of the image when it was packed, e.g. designs/bitacora_diaria_empty.png.
+
+        Returns:
+            Read only image backed by the memory mapped pack.
+        """
+        image_entry = self._index[image_path]
+        raw_mode = image_entry["raw_mode"]
+        return Image.frombuffer(raw_mode, (image_entry["width"], image_entry["height"]),
+                                self._get_asset_data(image_entry), "raw", raw_mode, 0, 1)
+
+    def get_image_mode(self, image_path: str) -> str:
+        return self._index[image_path]["mode"]
+
+    def get_font(self, font_file: str, font_size: int) -> ImageFont.FreeTypeFont:
+        font = ImageFont.truetype(io.BytesIO(self._get_asset_data(self._index[font_file])), size=font_size)
+        font.path = font_file
+        return font
+
+
+@lru_cache(maxsize=None)
+def get_asset_pack() -> AssetPack | None:
+    """Get the asset pack of the run, None when it wasn't built and the assets are read from the loose files."""
+    if not os.path.exists(ASSET_PACK_FILE):
+        return None
+
+    logging.info(f"Using asset pack {ASSET_PACK_FILE}")
+    return AssetPack(ASSET_PACK_FILE)
@@ -0,0 +1,69 @@
+import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+from src.cli_processor import get_week_start_date
+from src.data.profile_model import Profile
+from src.image_processor import open_template
+from src.page_layout import get_page_layout
+from src.page_preflight import PreflightPolicy
+from src.page_processor import PageProcessor
+
+
+def generate_profile_pages(profile: Profile) -> list[str]:
+    """Generate and save the pages of today for a profile, the weekly page is added on weekends.
+
+    The pages go through the preflight, which flags the blank pages and the pages printed before in its report.
+
+    Args:
+        profile: Profile to generate the pages for.
+
+    Returns:
+        List with the filenames of the saved PDFs.
+    """
+    logging.info(f"Generating pages for profile {profile.name}")
+    page_processor = PageProcessor(profile)
+    day_date = profile.current_date
+    os.makedirs(profile.output_folder, exist_ok=True)
+
+    day_page_title = f"{profile.output_folder}/bitacora-day-print-{day_date.strftime('%d-%b-%Y').lower()}"
+    page_processor.save_pages_as_pdf(day_page_title, [page_processor.generate_daily_tasks_page(day_date)],
+                                     preflight_policy=PreflightPolicy())
+    saved_files = [f"{day_page_title}.pdf"]
+
+    if day_date.weekday() >= 5:
+        week_start_date = get_week_start_date(day_date)
+        week_page_title = f"{profile.output_folder}/bitacora-week-print-{week_start_date.strftime('%d-%b-%Y').lower()}"
+        page_processor.save_pages_as_pdf(week_page_title,
+                                         [open_template(get_page_layout("weekly_reflection")["template"]),
+                                          page_processor.generate_weekly_tasks_page(week_start_date)],
+                                         preflight_policy=PreflightPolicy())
+        saved_files.append(f"{week_page_title}.pdf")
+
+    page_processor.data_processor.log_call_summary()
+    return saved_files
+
+
+def generate_profiles_pages(profiles: list[Profile], max_workers: int | None = None) -> dict[str, list[str]]:
+    """Generate the pages of several profiles concurrently.
+
+    The profiles run in threads of the same process, so the decoded templates, fonts and compiled layouts are shared.
+
+    Args:
+        profiles: Profiles to generate the pages for.
+        max_workers: Maximum number of profiles generated at the same time, defaults to one per profile.
+
+    Returns:
+        Dictionary with the saved PDFs of every profile, profiles that failed are logged and left out.
+    """
+    saved_files = {}
+    with ThreadPoolExecutor(max_workers=max_workers or len(profiles)) as executor:
+        profiles_futures = {profile.name: executor.submit(generate_profile_pages, profile) for profile in profiles}
+
+        for profile_name, profile_future in profiles_futures.items():
+            try:
+                saved_files[profile_name] = profile_future.result()
+            except Exception:
+                logging.exception(f"Could not generate the pages of profile {profile_name}")
+
+    return saved_files
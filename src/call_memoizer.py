@@ -0,0 +1,68 @@
+import threading
+from collections import Counter
+from concurrent.futures import Future
+from typing import Any, Callable, Hashable
+
+
+class CallMemoizer:
+    """Single flight memoization of remote client calls for the duration of a run.
+
+    The first call with a name and arguments runs the function, later calls get its result, and calls made while the
+    first one is still in flight wait for it instead of sending the same request again. Failed calls are not
+    remembered, the waiting calls get the error and the next call tries again.
+
+    Attributes:
+        hits: Calls answered with a memoized or in flight result, by call name.
+        misses: Calls that ran the function, by call name.
+    """
+
+    def __init__(self):
+        self._calls: dict[tuple[str, tuple[Hashable, ...]], Future] = {}
+        self._lock = threading.Lock()
+        self.hits: Counter[str] = Counter()
+        self.misses: Counter[str] = Counter()
+
+    def call(self, call_name: str, function: Callable[..., Any], *args: Hashable) -> Any:
+        """Call a function once per run for the same call name and arguments.
+
+        Args:
+            call_name: Name of the call, used as part of the key and for the counters.
+            function: Function to call on a miss.
+            *args: Arguments of the function, they must be hashable.
+
+        Returns:
+            Result of the function, the same object is returned to every caller.
+        """
+        call_key = (call_name, args)
+        with self._lock:
+            call_future = self._calls.get(call_key)
+            is_first_call = call_future is None
+            if is_first_call:
+                call_future = Future()
+                self._calls[call_key] = call_future
+                self.misses[call_name] += 1
+            else:
+                self.hits[call_name] += 1
+
+        if is_first_call:
+            try:
+                call_future.set_result(function(*args))
+            except Exception as error:
+                with self._lock:
+                    self._calls.pop(call_key, None)
+                call_future.set_exception(error)
+
+        return call_future.result()
+
+    def clear(self):
+        """Forget the memoized results and reset the counters, call it when a new run starts."""
+        with self._lock:
+            self._calls.clear()
+            self.hits.clear()
+            self.misses.clear()
+
+    def get_summary(self) -> dict[str, tuple[int, int]]:
+        """Get the hits and misses of every call name."""
+        with self._lock:
+            return {call_name: (self.hits[call_name], self.misses[call_name])
+                    for call_name in sorted(self.hits.keys() | self.misses.keys())}
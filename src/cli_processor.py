@@ -3,6 +3,11 @@ from datetime import datetime, timedelta
 from config import DEFAULT_TASK_DELTA_DAYS, DEFAULT_LOGS_DELTA_DAYS, CURRENT_DATE
 
 
+def get_week_start_date(date: datetime) -> datetime:
+    """Gets the start date of the weekly page that contains a date, the saturday of its week."""
+    return date - timedelta(days=date.weekday()) + timedelta(days=5)
+
+
 def get_pages_dates() -> tuple[datetime, datetime | None]:
     """Gets the dates for which to generate pages.
 
@@ -32,7 +37,6 @@ def get_pages_dates() -> tuple[datetime, datetime | None]:
         if not is_weekend:
             week_delta_offset -= 1
 
-        week_date = CURRENT_DATE + timedelta(weeks=week_delta_offset)
-        week_start_date = week_date - timedelta(days=week_date.weekday()) + timedelta(days=5)
+        week_start_date = get_week_start_date(CURRENT_DATE + timedelta(weeks=week_delta_offset))
 
     return day_date, week_start_date
@@ -27,3 +27,20 @@ class ActiveTaskColumns(Enum):
     @classmethod
     def get_column_ids(cls):
         return tuple(item.value for item in cls)
+
+
+@define(frozen=True)
+class TaskColumnIds:
+    """Task column ids of a profile, defaults to the ActiveTaskColumns ids."""
+    day_work_great: str = ActiveTaskColumns.DAY_WORK_GREAT.value
+    day_work_amazing: str = ActiveTaskColumns.DAY_WORK_AMAZING.value
+    day_personal_great: str = ActiveTaskColumns.DAY_PERSONAL_GREAT.value
+    day_personal_amazing: str = ActiveTaskColumns.DAY_PERSONAL_AMAZING.value
+    week_work_great: str = ActiveTaskColumns.WEEK_WORK_GREAT.value
+    week_work_amazing: str = ActiveTaskColumns.WEEK_WORK_AMAZING.value
+    week_personal_great: str = ActiveTaskColumns.WEEK_PERSONAL_GREAT.value
+    week_personal_amazing: str = ActiveTaskColumns.WEEK_PERSONAL_AMAZING.value
+
+    def get_column_ids(self) -> tuple[str, ...]:
+        return (self.day_work_great, self.day_work_amazing, self.day_personal_great, self.day_personal_amazing,
+                self.week_work_great, self.week_work_amazing, self.week_personal_great, self.week_personal_amazing)
@@ -0,0 +1,10 @@
+from attr import define
+
+
+@define(frozen=True)
+class HourlyForecastModel:
+    """Weather forecast of an hour of the day, kind is the name of a python_weather Kind."""
+    hour: int
+    temperature: int
+    feels_like: int
+    kind: str
@@ -0,0 +1,85 @@
+import json
+import os
+from datetime import datetime
+from zoneinfo import ZoneInfo
+
+from attr import define, field
+from nothion._config import NT_NOTES_DB_ID, NT_STATS_DB_ID
+
+from config import (CURRENT_TIMEZONE, NEW_PAGES_FOLDER, WEATHER_LOCATION, CACHE_FOLDER, STATS_CACHE_FILE,
+                    LAST_KNOWN_DATA_FILE)
+from src.data.active_task_model import TaskColumnIds
+
+
+@define(frozen=True)
+class NotionDatabaseIds:
+    """Notion database ids of a profile, defaults to the nothion ids read from NT_NOTES_DB_ID and NT_STATS_DB_ID."""
+    notes: str = NT_NOTES_DB_ID
+    stats: str = NT_STATS_DB_ID
+
+
+@define
+class Profile:
+    """Bitacora profile of one person.
+
+    Credentials are read from environment variables with the profile prefix, e.g. the profile with prefix "ANA_"
+    reads ANA_TT_USER, ANA_TT_PASS, ANA_NT_AUTH and ANA_OPENAI_API_KEY. The default profile has an empty prefix.
+    """
+    name: str
+    credentials_env_prefix: str = ""
+    timezone: ZoneInfo = CURRENT_TIMEZONE
+    weather_location: str = WEATHER_LOCATION
+    output_folder: str = NEW_PAGES_FOLDER
+    task_columns: TaskColumnIds = field(factory=TaskColumnIds)
+    notion_databases: NotionDatabaseIds = field(factory=NotionDatabaseIds)
+
+    def get_credential(self, credential_name: str) -> str | None:
+        return os.getenv(f"{self.credentials_env_prefix}{credential_name}")
+
+    @property
+    def current_date(self) -> datetime:
+        return datetime.now(self.timezone)
+
+    @property
+    def stats_cache_file(self) -> str:
+        if self is DEFAULT_PROFILE:
+            return STATS_CACHE_FILE
+        return f"{CACHE_FOLDER}/{self.name}_stats_cache.json"
+
+    @property
+    def last_known_data_file(self) -> str:
+        if self is DEFAULT_PROFILE:
+            return LAST_KNOWN_DATA_FILE
+        return f"{CACHE_FOLDER}/{self.name}_last_known_data.json"
+
+    @classmethod
+    def from_dict(cls, raw_profile: dict) -> "Profile":
+        """Create a profile from an entry of the profiles file, missing keys take the default values."""
+        raw_profile = dict(raw_profile)
+        if "timezone" in raw_profile:
+            raw_profile["timezone"] = ZoneInfo(raw_profile["timezone"])
+        if "task_columns" in raw_profile:
+            raw_profile["task_columns"] = TaskColumnIds(**raw_profile["task_columns"])
+        if "notion_databases" in raw_profile:
+            raw_profile["notion_databases"] = NotionDatabaseIds(**raw_profile["notion_databases"])
+
+        return cls(**raw_profile)
+
+
+DEFAULT_PROFILE = Profile(name="default")
+
+
+def load_profiles(profiles_file: str) -> list[Profile]:
+    """Load the profiles file, a JSON list of profiles.
+
+    Args:
+        profiles_file: Path to the profiles file.
+
+    Returns:
+        List of profiles, only the default profile if the file doesn't exist.
+    """
+    if not os.path.exists(profiles_file):
+        return [DEFAULT_PROFILE]
+
+    with open(profiles_file, encoding="utf-8") as profiles:
+        return [Profile.from_dict(raw_profile) for raw_profile in json.load(profiles)]
@@ -1,27 +1,85 @@
 import json
 import logging
-import os
 from datetime import datetime, timezone, timedelta
 
-from typing import List, Any
+from typing import Any, Callable, Iterator, TypeVar
 
-from nothion._config import NT_LOGS_DB_ID
 from openai import OpenAI
 
-from nothion import NotionClient, PersonalStats
-from tickthon import TicktickClient, Task
+from nothion import PersonalStats
+from tickthon import Task
 
+from config import LATENCY_BUDGETS
 from src.ai_prompts import AIPrompts
+from src.call_memoizer import CallMemoizer
 from src.data.active_task_model import ActiveTaskModel
+from src.data.hourly_forecast_model import HourlyForecastModel
+from src.data.profile_model import Profile, DEFAULT_PROFILE
+from src.http_transport import HttpTransport, get_shared_transport
+from src.image_processor import get_weather_forecast
+from src.latency_budget import LastKnownData, run_with_budget
+from src.pooled_clients import PooledTicktickClient, PooledNotionClient
+from src.stats_cache import StatsCache
+
+T = TypeVar("T")
 
 
 class DataProcessor:
-    def __init__(self):
-        username = os.getenv("TT_USER")
-        password = os.getenv("TT_PASS")
-        self.ticktick_client = TicktickClient(os.getenv("TT_USER"), os.getenv("TT_PASS"))
-        self.notion_client = NotionClient(os.getenv("NT_AUTH"))
-        self.openai_client = OpenAI(api_key=os.environ.get("OPENAI_API_KEY"))
+    def __init__(self, profile: Profile = DEFAULT_PROFILE, transport: HttpTransport | None = None):
+        self.profile = profile
+        self.transport = transport or get_shared_transport()
+        self.call_memoizer = CallMemoizer()
+        self.ticktick_client = PooledTicktickClient(profile.get_credential("TT_USER"),
+                                                    profile.get_credential("TT_PASS"),
+                                                    self.transport, self.call_memoizer)
+        self.notion_client = PooledNotionClient(profile.get_credential("NT_AUTH"), self.transport,
+                                                profile.notion_databases)
+        self.openai_client = OpenAI(api_key=profile.get_credential("OPENAI_API_KEY"),
+                                    http_client=self.transport.httpx_client,
+                                    max_retries=self.transport.retries)
+        self.stats_cache = StatsCache(self.notion_client, profile.stats_cache_file, profile.current_date)
+        self.latency_budgets = dict(LATENCY_BUDGETS)
+        self.last_known_data = LastKnownData(profile.last_known_data_file)
+        self._prefetched_journal_data: dict[str, dict] = {}
+
+    def start_run(self):
+        """Start a new run, the remote resources fetched from now on are fetched again once."""
+        self.call_memoizer.clear()
+        self.stats_cache.start_run(self.profile.current_date)
+        self._prefetched_journal_data.clear()
+
+    def get_within_budget(self, source: str, key: str, fetch: Callable[[], T], default: T,
+                          decode: Callable[[Any], T] = lambda raw_value: raw_value) -> tuple[T, bool]:
+        """Fetch the data of a source within its latency budget, falling back to the last known data.
+
+        Args:
+            source: Source of the data, one of the LATENCY_BUDGETS keys.
+            key: Key of the data in the source, e.g. the date of the page.
+            fetch: Function that fetches the data.
+            default: Data used when the source is over budget and there is no last known data.
+            decode: Function that rebuilds the data from its last known JSON value.
+
+        Returns:
+            Tuple with the data and whether it is degraded, i.e. last known or default data.
+        """
+        budget_seconds = self.latency_budgets[source]
+        try:
+            data = run_with_budget(fetch, budget_seconds)
+        except TimeoutError:
+            logging.warning(f"Getting {source} took more than {budget_seconds} seconds, using the last known data")
+        except Exception:
+            logging.exception(f"Could not get {source}, using the last known data")
+        else:
+            self.last_known_data.set(source, key, data)
+            return data, False
+
+        raw_data = self.last_known_data.get(source, key)
+        return (default if raw_data is None else decode(raw_data)), True
+
+    def log_call_summary(self):
+        """Log the memoization hits and misses of the remote client calls of the run."""
+        for call_name, (hits, misses) in self.call_memoizer.get_summary().items():
+            logging.info(f"{call_name}: {misses} fetched, {hits} reused")
 
     def _process_task_title(self, task: Task, max_title_length: int) -> str:
         """Extract and process task titles.
@@ -96,7 +154,7 @@ class DataProcessor:
         """
         logging.info(f"Getting active tasks for date {date}")
 
-        day_tasks = self.ticktick_client.get_active_tasks()
+        day_tasks = self.call_memoizer.call("get_active_tasks", self.ticktick_client.get_active_tasks)
 
         if date:
             day_tasks = [task for task in day_tasks if task.due_date.startswith(date)]
@@ -115,44 +173,115 @@ class DataProcessor:
 
         return processed_task_titles
 
-    def _process_log_titles(self, logs: List[Task]) -> List[str]:
-        max_amount_logs = 20
-        logs = logs[:max_amount_logs]
+    def _process_log_title(self, log: Task) -> str:
+        log_title = f"{datetime.fromisoformat(log.created_date).strftime('%I:%M %p').lower()} {log.title}"
+        log_title = log_title.strip()
 
-        processed_logs = []
-        for log in logs:
-            log_title = f"{datetime.fromisoformat(log.created_date).strftime('%I:%M %p').lower()} {log.title}"
-            log_title = log_title.strip()
+        if "highlight" in log.tags:
+            log_title = f" щ {log_title}"
 
-            if "highlight" in log.tags:
-                log_title = f" щ {log_title}"
+        max_char_length = 62
+        if len(log_title) >= max_char_length:
+            log_title = log_title[:max_char_length] + "..."
 
-            max_char_length = 62
-            if len(log_title) >= max_char_length:
-                log_title = log_title[:max_char_length] + "..."
+        return log_title
 
-            processed_logs.append(log_title)
+    def get_day_logs(self, date: str) -> Iterator[str]:
+        """Get the titles of the logs of a day in chronological order.
 
-        return processed_logs
+        The titles are formatted lazily as they are consumed, so the logs pages can be laid out and saved one at a
+        time however many logs the day has.
 
-    def get_day_logs(self, date: str) -> List[str]:
-        logging.info(f"Getting active tasks for date {date}")
+        Args:
+            date: Date of the logs in format YYYY-MM-DD.
 
-        all_logs = self.ticktick_client.get_day_logs()
+        Returns:
+            Iterator with the formatted log titles.
+        """
+        logging.info(f"Getting logs for date {date}")
+
+        all_logs = self.call_memoizer.call("get_day_logs", self.ticktick_client.get_day_logs)
 
         day_logs = [task for task in all_logs if task.created_date.startswith(date)]
         sorted_logs = sorted(day_logs, key=lambda task: task.created_date)
-        log_titles = self._process_log_titles(sorted_logs)
 
-        return log_titles
+        return map(self._process_log_title, sorted_logs)
+
+    def get_day_weather(self, date: datetime) -> list[HourlyForecastModel]:
+        """Get the hourly weather forecast of a day at the profile weather location.
+
+        Args:
+            date: Date of the forecast.
+
+        Returns:
+            Hourly forecasts of the day, empty if the date is out of the forecast range.
+        """
+        logging.info(f"Getting weather for date {date}")
+        location = self.profile.weather_location
+        forecasts = self.transport.run_async(
+            lambda session: get_weather_forecast(self.latency_budgets["weather"], location, session))
+
+        date_forecast = next((forecast for forecast in forecasts if forecast.date == date.date()), None)
+        if date_forecast is None:
+            return []
+
+        return [HourlyForecastModel(hour=hour_forecast.time.hour, temperature=hour_forecast.temperature,
+                                    feels_like=hour_forecast.feels_like, kind=hour_forecast.kind.name)
+                for hour_forecast in date_forecast.hourly]
 
     def get_day_stats(self, date: datetime) -> PersonalStats:
         logging.info(f"Getting stats for date {date}")
-        return self.notion_client.get_stats_between_dates(date, date)[0]
+        return self.call_memoizer.call("get_day_stats", self.stats_cache.get_day_stats, date)
+
+    def get_stats_between_dates(self, start_date: datetime, end_date: datetime) -> list[PersonalStats]:
+        logging.info(f"Getting stats between {start_date} and {end_date}")
+        return self.call_memoizer.call("get_stats_between_dates", self.stats_cache.get_stats_between_dates,
+                                       start_date, end_date)
+
+    def prefetch_stats(self, dates: list[datetime]):
+        """Fetch the stats of several dates with a single Notion query.
+
+        Args:
+            dates: Dates that will be requested during the run.
+        """
+        if not dates:
+            return
+
+        try:
+            run_with_budget(lambda: self.stats_cache.prefetch(min(dates), max(dates)), self.latency_budgets["stats"])
+        except Exception:
+            logging.warning("Could not prefetch the stats, they will be fetched one by one")
+
+    def prefetch_journal_data(self, dates: list[datetime]):
+        """Fetch the daily journal entries of several dates with a single Notion query.
+
+        Dates without a journal entry are not prefetched, they are still fetched one by one when requested.
+
+        Args:
+            dates: Dates that will be requested during the run.
+        """
+        if not dates:
+            return
+
+        try:
+            journals_data = run_with_budget(
+                lambda: self.notion_client.get_daily_journals_between_dates(min(dates), max(dates)),
+                self.latency_budgets["journal_url"])
+        except Exception:
+            logging.warning("Could not prefetch the journal entries, they will be fetched one by one")
+            return
+
+        for journal_data in journals_data:
+            journal_date = journal_data["properties"]["Due date"]["date"]["start"][:10]
+            self._prefetched_journal_data.setdefault(journal_date, journal_data)
 
     def get_day_journal_url(self, date: datetime) -> str:
         logging.info(f"Getting journal url for date {date}")
-        return self.notion_client.get_daily_journal_data(date).get("url", "")
+        journal_data = self._prefetched_journal_data.get(date.strftime("%Y-%m-%d"))
+        if journal_data is None:
+            journal_data = self.call_memoizer.call("get_daily_journal_data",
+                                                   self.notion_client.get_daily_journal_data, date)
+        return journal_data.get("url", "")
 
     def _find_value_recursively(self, raw_list: list, key: str) -> list:
         """Find a value in a list of lists recursively.
@@ -190,9 +319,10 @@ class DataProcessor:
         return flattened_list
 
     def _get_journal_content(self, date: datetime, keyword: str, start_block: int) -> list:
-        raw_journal_content = self.notion_client.get_daily_journal_content(date)
+        raw_journal_content = self.call_memoizer.call("get_daily_journal_content",
+                                                      self.notion_client.get_daily_journal_content, date)
 
-        journal_reflection = self._find_value_recursively(raw_journal_content, keyword).pop()
+        journal_reflection = self._find_value_recursively(raw_journal_content, keyword)[-1]
         journal_reflection_summary = self._flatten_list_recursively(journal_reflection[start_block:])
 
         return journal_reflection_summary
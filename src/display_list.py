@@ -0,0 +1,236 @@
+import base64
+import io
+import json
+
+from attr import define, evolve, field
+from PIL import Image, ImageFont
+from PIL.Image import Image as ImageType
+
+from src.image_processor import ScaledImageDraw, get_font, open_template
+
+
+@define(frozen=True)
+class TextOp:
+    """Draw a text with a font file and size."""
+    xy: tuple[float, float]
+    text: str
+    font_file: str
+    font_size: int
+    fill: str = "black"
+    anchor: str | None = None
+    spacing: float = 4
+
+
+@define(frozen=True)
+class LineOp:
+    """Draw a line between the given points."""
+    xy: tuple[float, ...]
+    fill: str = "black"
+    width: int = 0
+
+
+@define(frozen=True)
+class RectangleOp:
+    """Draw a rectangle, filled and/or outlined."""
+    xy: tuple[float, float, float, float]
+    fill: str | None = None
+    outline: str | None = None
+    width: int = 1
+
+
+@define(frozen=True)
+class PasteOp:
+    """Paste an image, optionally using a mask."""
+    xy: tuple[int, int]
+    image: ImageType
+    mask: ImageType | None = None
+
+
+DrawOp = TextOp | LineOp | RectangleOp | PasteOp
+
+
+def _translate_op(op: DrawOp, delta_x: float, delta_y: float) -> DrawOp:
+    """Move a draw operation, line and rectangle coordinates are flat sequences of x and y values."""
+    match op:
+        case LineOp() | RectangleOp():
+            return evolve(op, xy=tuple(coordinate + (delta_x if coordinate_index % 2 == 0 else delta_y)
+                                       for coordinate_index, coordinate in enumerate(op.xy)))
+        case PasteOp():
+            return evolve(op, xy=(round(op.xy[0] + delta_x), round(op.xy[1] + delta_y)))
+        case _:
+            return evolve(op, xy=(op.xy[0] + delta_x, op.xy[1] + delta_y))
+
+
+def _is_op_in_box(op: DrawOp, box: tuple[float, float, float, float]) -> bool:
+    """Check if the first point of a draw operation is inside a box."""
+    x0, y0, x1, y1 = box
+    return x0 <= op.xy[0] < x1 and y0 <= op.xy[1] < y1
+
+
+def _encode_image(image: ImageType | None) -> str | None:
+    if image is None:
+        return None
+
+    image_buffer = io.BytesIO()
+    image.save(image_buffer, "PNG")
+    return base64.b64encode(image_buffer.getvalue()).decode("ascii")
+
+
+def _decode_image(raw_image: str | None) -> ImageType | None:
+    if raw_image is None:
+        return None
+
+    return Image.open(io.BytesIO(base64.b64decode(raw_image)))
+
+
+@define
+class DisplayList:
+    """List of draw operations over a page template, in full scale page coordinates.
+
+    Attributes:
+        template: Path to the page template.
+        ops: Draw operations in order.
+        degraded_sections: Sections drawn with last known or empty data because their source was over budget.
+    """
+    template: str
+    ops: list[DrawOp] = field(factory=list)
+    degraded_sections: list[str] = field(factory=list)
+
+    def replay(self, base_image: ScaledImageDraw):
+        """Replay the draw operations on a draw object, the draw object takes care of the scale.
+
+        Args:
+            base_image: Draw object of the page to replay the operations on.
+        """
+        for op in self.ops:
+            match op:
+                case TextOp():
+                    base_image.text(op.xy, op.text, font=get_font(op.font_file, op.font_size), fill=op.fill,
+                                    anchor=op.anchor, spacing=op.spacing)
+                case LineOp():
+                    base_image.line(op.xy, fill=op.fill, width=op.width)
+                case RectangleOp():
+                    base_image.rectangle(op.xy, fill=op.fill, outline=op.outline, width=op.width)
+                case PasteOp():
+                    base_image.paste(op.image, op.xy, op.mask)
+
+    def render(self, scale: float = 1) -> ImageType:
+        """Render the display list on a raster page.
+
+        Args:
+            scale: Scale at which the page is rendered, use values below 1 for quick previews.
+
+        Returns:
+            Image object with the rendered page, its info has the template, the scale and the degraded sections.
+        """
+        page = open_template(self.template, scale)
+        self.replay(ScaledImageDraw(page, scale))
+        page.info.update({"template": self.template, "scale": scale})
+        if self.degraded_sections:
+            page.info["degraded_sections"] = list(self.degraded_sections)
+        return page
+
+    def render_region(self, page: ImageType, box: tuple[int, int, int, int]) -> ImageType:
+        """Render again a region of a full scale page rendered from a previous version of the display list.
+
+        The region of the template is cropped and every operation is replayed moved to the region, the drawing
+        outside of it is clipped, so the region is the same as in a full render.
+
+        Args:
+            page: Page to update, it's modified in place.
+            box: Region to render in page coordinates, (left, top, right, bottom).
+
+        Returns:
+            Page with the region rendered.
+        """
+        x0, y0, x1, y1 = box
+        region = open_template(self.template).crop(box)
+        DisplayList(template=self.template,
+                    ops=[_translate_op(op, -x0, -y0) for op in self.ops]).replay(ScaledImageDraw(region))
+        page.paste(region, (x0, y0))
+        return page
+
+    def get_changed_sections(self, previous_display_list: "DisplayList",
+                             sections: dict[str, tuple[int, int, int, int]]) -> list[str]:
+        """Compare the operations of every section with a previous version of the display list.
+
+        Args:
+            previous_display_list: Previous version of the display list.
+            sections: Boxes of the page sections by name, an operation belongs to the boxes with its first point.
+
+        Returns:
+            Names of the sections with different operations.
+        """
+        return [section_name for section_name, box in sections.items()
+                if [op for op in self.ops if _is_op_in_box(op, box)]
+                != [op for op in previous_display_list.ops if _is_op_in_box(op, box)]]
+
+    def to_json(self) -> str:
+        """Serialize the display list, pasted images are embedded as PNG."""
+        raw_ops = []
+        for op in self.ops:
+            match op:
+                case TextOp():
+                    raw_ops.append({"op": "text", "xy": op.xy, "text": op.text, "font_file": op.font_file,
+                                    "font_size": op.font_size, "fill": op.fill, "anchor": op.anchor,
+                                    "spacing": op.spacing})
+                case LineOp():
+                    raw_ops.append({"op": "line", "xy": op.xy, "fill": op.fill, "width": op.width})
+                case RectangleOp():
+                    raw_ops.append({"op": "rectangle", "xy": op.xy, "fill": op.fill, "outline": op.outline,
+                                    "width": op.width})
+                case PasteOp():
+                    raw_ops.append({"op": "paste", "xy": op.xy, "image": _encode_image(op.image),
+                                    "mask": _encode_image(op.mask)})
+
+        return json.dumps({"template": self.template, "ops": raw_ops, "degraded_sections": self.degraded_sections})
+
+    @classmethod
+    def from_json(cls, raw_display_list: str) -> "DisplayList":
+        """Deserialize a display list created with to_json."""
+        display_list = json.loads(raw_display_list)
+
+        ops: list[DrawOp] = []
+        for raw_op in display_list["ops"]:
+            match raw_op.pop("op"):
+                case "text":
+                    ops.append(TextOp(**{**raw_op, "xy": tuple(raw_op["xy"])}))
+                case "line":
+                    ops.append(LineOp(**{**raw_op, "xy": tuple(raw_op["xy"])}))
+                case "rectangle":
+                    ops.append(RectangleOp(**{**raw_op, "xy": tuple(raw_op["xy"])}))
+                case "paste":
+                    ops.append(PasteOp(xy=tuple(raw_op["xy"]), image=_decode_image(raw_op["image"]),
+                                       mask=_decode_image(raw_op["mask"])))
+
+        return cls(template=display_list["template"], ops=ops,
+                   degraded_sections=display_list.get("degraded_sections", []))
+
+
+class DisplayListDraw:
+    """Draw object that records the draw operations of the image_processor functions in a display list.
+
+    It exposes the subset of the ImageDraw interface used by the layout functions, so the page layout logic runs
+    once and the resulting display list can be replayed on any backend.
+    """
+
+    def __init__(self, template: str):
+        self.display_list = DisplayList(template=template)
+
+    def text(self, xy, text: str, fill: str = "black", font: ImageFont.FreeTypeFont | None = None,
+             anchor: str | None = None, spacing: float = 4):
+        self.display_list.ops.append(TextOp(xy=tuple(xy), text=text, font_file=font.path, font_size=font.size,
+                                            fill=fill, anchor=anchor, spacing=spacing))
+
+    def line(self, xy, fill: str = "black", width: int = 0):
+        self.display_list.ops.append(LineOp(xy=tuple(xy), fill=fill, width=width))
+
+    def rectangle(self, xy, fill: str | None = None, outline: str | None = None, width: int = 1):
+        self.display_list.ops.append(RectangleOp(xy=tuple(xy), fill=fill, outline=outline, width=width))
+
+    def paste(self, image: ImageType, xy: tuple[int, int], mask: ImageType | None = None):
+        self.display_list.ops.append(PasteOp(xy=tuple(xy), image=image, mask=mask))
+
+    @staticmethod
+    def textlength(text: str, font: ImageFont.FreeTypeFont) -> float:
+        return font.getlength(text)
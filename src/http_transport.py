@@ -0,0 +1,119 @@
+import asyncio
+import atexit
+import threading
+from functools import lru_cache
+from typing import Awaitable, Callable, TypeVar
+
+import httpx
+from aiohttp import ClientSession, ClientTimeout, TCPConnector
+from requests import Session
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from config import (HTTP_POOL_SIZE, HTTP_MAX_CONCURRENCY, HTTP_RETRIES, HTTP_BACKOFF_FACTOR, HTTP_TIMEOUT,
+                    HTTP_KEEPALIVE_SECONDS)
+
+T = TypeVar("T")
+
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+
+
+class BoundedHTTPAdapter(HTTPAdapter):
+    """HTTPAdapter that limits the requests in flight and applies a default timeout."""
+
+    def __init__(self, semaphore: threading.BoundedSemaphore, timeout: float, **kwargs):
+        self.semaphore = semaphore
+        self.timeout = timeout
+        super().__init__(**kwargs)
+
+    def send(self, request, timeout=None, **kwargs):
+        with self.semaphore:
+            return super().send(request, timeout=timeout or self.timeout, **kwargs)
+
+
+class HttpTransport:
+    """HTTP transport shared by the remote clients, with keep-alive connection pools, bounded concurrency and retries.
+
+    The requests based clients (TickTick and Notion) get their own session, so their headers and cookies don't mix,
+    but every session mounts the same adapter and reuses its connection pools. OpenAI uses a shared httpx client and
+    the weather client a shared aiohttp session that lives in a background event loop.
+    """
+
+    def __init__(self, pool_size: int = HTTP_POOL_SIZE, max_concurrency: int = HTTP_MAX_CONCURRENCY,
+                 retries: int = HTTP_RETRIES, backoff_factor: float = HTTP_BACKOFF_FACTOR,
+                 timeout: float = HTTP_TIMEOUT, keepalive_seconds: float = HTTP_KEEPALIVE_SECONDS):
+        self.pool_size = pool_size
+        self.max_concurrency = max_concurrency
+        self.retries = retries
+        self.backoff_factor = backoff_factor
+        self.timeout = timeout
+        self.keepalive_seconds = keepalive_seconds
+
+        retry = Retry(total=retries, backoff_factor=backoff_factor, status_forcelist=RETRY_STATUS_CODES,
+                      allowed_methods=Retry.DEFAULT_ALLOWED_METHODS, raise_on_status=False)
+        self.http_adapter = BoundedHTTPAdapter(threading.BoundedSemaphore(max_concurrency), timeout,
+                                               pool_connections=pool_size, pool_maxsize=pool_size,
+                                               max_retries=retry)
+        self.httpx_client = httpx.Client(timeout=timeout,
+                                         limits=httpx.Limits(max_connections=max_concurrency,
+                                                             max_keepalive_connections=pool_size,
+                                                             keepalive_expiry=keepalive_seconds),
+                                         transport=httpx.HTTPTransport(retries=retries))
+
+        self._event_loop: asyncio.AbstractEventLoop | None = None
+        self._aiohttp_session: ClientSession | None = None
+        self._event_loop_lock = threading.Lock()
+
+    def create_session(self) -> Session:
+        """Create a requests session that sends its requests through the shared connection pools."""
+        session = Session()
+        session.mount("https://", self.http_adapter)
+        session.mount("http://", self.http_adapter)
+        return session
+
+    def _get_event_loop(self) -> asyncio.AbstractEventLoop:
+        with self._event_loop_lock:
+            if self._event_loop is None:
+                self._event_loop = asyncio.new_event_loop()
+                threading.Thread(target=self._event_loop.run_forever, name="http-transport-loop", daemon=True).start()
+
+        return self._event_loop
+
+    async def _get_aiohttp_session(self) -> ClientSession:
+        if self._aiohttp_session is None:
+            self._aiohttp_session = ClientSession(timeout=ClientTimeout(total=self.timeout),
+                                                  connector=TCPConnector(limit=self.max_concurrency,
+                                                                         keepalive_timeout=self.keepalive_seconds))
+        return self._aiohttp_session
+
+    def run_async(self, coroutine_function: Callable[[ClientSession], Awaitable[T]]) -> T:
+        """Run a coroutine that uses the shared aiohttp session and wait for its result.
+
+        Args:
+            coroutine_function: Function that receives the aiohttp session and returns the coroutine to run.
+
+        Returns:
+            Result of the coroutine.
+        """
+        async def run_with_session():
+            return await coroutine_function(await self._get_aiohttp_session())
+
+        return asyncio.run_coroutine_threadsafe(run_with_session(), self._get_event_loop()).result()
+
+    def close(self):
+        """Close the connection pools and stop the background event loop."""
+        self.http_adapter.close()
+        self.httpx_client.close()
+
+        if self._event_loop is not None:
+            if self._aiohttp_session is not None:
+                asyncio.run_coroutine_threadsafe(self._aiohttp_session.close(), self._event_loop).result()
+            self._event_loop.call_soon_threadsafe(self._event_loop.stop)
+
+
+@lru_cache(maxsize=None)
+def get_shared_transport() -> HttpTransport:
+    """Get the transport shared by every DataProcessor of the process, it is closed when the process exits."""
+    transport = HttpTransport()
+    atexit.register(transport.close)
+    return transport
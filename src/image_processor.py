@@ -1,25 +1,147 @@
 import asyncio
 from datetime import datetime, timedelta
+from functools import lru_cache
+from itertools import islice
 import logging
-from typing import List
+from typing import Iterator, Protocol
 
+import numpy as np
 import python_weather
-from PIL import Image, ImageFont
-from PIL.ImageDraw import ImageDraw as ImageDrawType
+from PIL import Image, ImageDraw, ImageFont
 from PIL.Image import Image as ImageType
-from aiohttp import ClientConnectorError, ServerDisconnectedError
+from aiohttp import ClientSession
 from nothion import PersonalStats
 from python_weather import Kind
 import qrcode
 
-from src.data.active_task_model import ActiveTaskModel, ActiveTaskColumns
+from config import WEATHER_LOCATION
+from src.asset_pack import get_asset_pack
+from src.data.active_task_model import ActiveTaskModel, TaskColumnIds
+from src.data.hourly_forecast_model import HourlyForecastModel
+from src.page_layout import get_page_layout
+from src.stats_aggregation import STAT_NAMES, StatsSummary
 
-font_path = "fonts/RobotoMono-Regular.ttf"
-bold_font_path = "fonts/RobotoMono-Bold.ttf"
 date_format = "%d-%b"
 
 
-def add_day_date_to_img(base_image: ImageDrawType, date: datetime) -> ImageDrawType:
+@lru_cache(maxsize=None)
+def get_font(font_file: str, font_size: int) -> ImageFont.FreeTypeFont:
+    asset_pack = get_asset_pack()
+    if asset_pack is not None and asset_pack.has_font(font_file):
+        return asset_pack.get_font(font_file, font_size)
+    return ImageFont.truetype(font_file, size=font_size)
+
+
+@lru_cache(maxsize=None)
+def _get_scaled_template(template_path: str, scale: float) -> ImageType:
+    asset_pack = get_asset_pack()
+    if asset_pack is not None and asset_pack.has_image(template_path):
+        template = asset_pack.get_image(template_path)
+        if scale == 1:
+            return template
+        return template.resize((round(template.width * scale), round(template.height * scale)), Image.LANCZOS)
+
+    with Image.open(template_path) as template:
+        if scale == 1:
+            template.load()
+            return template.copy()
+        return template.resize((round(template.width * scale), round(template.height * scale)), Image.LANCZOS)
+
+
+def open_template(template_path: str, scale: float = 1) -> ImageType:
+    """Open a page template, templates are decoded, and downscaled for reduced scales, once per run and cached.
+
+    When the asset pack is built the templates are read from its memory mapped pixels instead of decoding the PNGs.
+
+    Args:
+        template_path: Path to the template image.
+        scale: Scale at which the page is rendered.
+
+    Returns:
+        Image object with the template, safe to draw on.
+    """
+    template = _get_scaled_template(template_path, scale)
+
+    asset_pack = get_asset_pack()
+    if asset_pack is not None and asset_pack.has_image(template_path):
+        return template.convert(asset_pack.get_image_mode(template_path))
+    return template.copy()
+
+
+class PageDraw(Protocol):
+    """Draw target of the add_*_to_img functions, implemented by DisplayListDraw and ScaledImageDraw.
+
+    Coordinates, font sizes and widths are full scale layout units.
+    """
+
+    def text(self, xy, text: str, fill: str = "black", font: ImageFont.FreeTypeFont | None = None,
+             anchor: str | None = None, spacing: float = 4): ...
+
+    def line(self, xy, fill: str = "black", width: int = 0): ...
+
+    def rectangle(self, xy, fill: str | None = None, outline: str | None = None, width: int = 1): ...
+
+    def paste(self, image: ImageType, xy: tuple[int, int], mask: ImageType | None = None): ...
+
+    def textlength(self, text: str, font: ImageFont.FreeTypeFont) -> float: ...
+
+
+class ScaledImageDraw(ImageDraw.ImageDraw):
+    """Image draw that renders the full scale layout constants on a reduced scale page.
+
+    Coordinates, font sizes, line widths and spacings are multiplied by the scale when drawing and text lengths are
+    returned in full scale units, so the layout code works the same at any scale.
+    """
+
+    def __init__(self, image: ImageType, scale: float = 1):
+        super().__init__(image)
+        self.scale = scale
+
+    def _scale_font(self, font: ImageFont.FreeTypeFont) -> ImageFont.FreeTypeFont:
+        return get_font(font.path, max(1, round(font.size * self.scale)))
+
+    def text(self, xy, text, *args, font=None, spacing=4, **kwargs):
+        if self.scale != 1:
+            xy = tuple(coordinate * self.scale for coordinate in xy)
+            font = self._scale_font(font) if font is not None else None
+            spacing *= self.scale
+        return super().text(xy, text, *args, font=font, spacing=spacing, **kwargs)
+
+    def textlength(self, text, font=None, *args, **kwargs):
+        if self.scale == 1:
+            return super().textlength(text, font, *args, **kwargs)
+        return super().textlength(text, self._scale_font(font), *args, **kwargs) / self.scale
+
+    def line(self, xy, fill=None, width=0, *args, **kwargs):
+        if self.scale != 1:
+            xy = tuple(coordinate * self.scale for coordinate in xy)
+            width = max(1, round(width * self.scale))
+        return super().line(xy, fill, width, *args, **kwargs)
+
+    def rectangle(self, xy, fill=None, outline=None, width=1):
+        if self.scale != 1:
+            xy = tuple(coordinate * self.scale for coordinate in xy)
+            width = max(1, round(width * self.scale))
+        return super().rectangle(xy, fill, outline, width)
+
+    def paste(self, image: ImageType, xy: tuple[int, int], mask: ImageType | None = None):
+        """Paste an image on the page behind the draw object.
+
+        Args:
+            image: Full scale image to paste.
+            xy: Full scale position of the upper left corner.
+            mask: Optional paste mask with the same size as the image.
+        """
+        if self.scale != 1:
+            scaled_size = (max(1, round(image.width * self.scale)), max(1, round(image.height * self.scale)))
+            image = image.resize(scaled_size)
+            mask = mask.resize(scaled_size) if mask is not None else None
+            xy = (round(xy[0] * self.scale), round(xy[1] * self.scale))
+
+        self._image.paste(image, xy, mask)
+
+
+def add_day_date_to_img(base_image: PageDraw, date: datetime) -> PageDraw:
     """Add day date to base image.
 
     Args:
@@ -34,17 +156,15 @@ def add_day_date_to_img(base_image: ImageDrawType, date: datetime) -> ImageDrawT
     day_number = date.timetuple().tm_yday
     formatted_date = date.strftime(date_format)
     base_color = "black"
-    base_width = 290
-    base_height = 50
-
-    base_image.text((base_width, base_height), day, font=ImageFont.truetype(font_path, size=195), fill=base_color)
-    base_image.text((base_width + 10, base_height + 200), f"Day {day_number}",
-                    font=ImageFont.truetype(font_path, size=68), fill=base_color)
-    base_image.text((base_width + 10, base_height + 270), formatted_date, font=ImageFont.truetype(font_path, size=68),
-                    fill=base_color)
+    date_layout = get_page_layout("daily_tasks")["date"]
+
+    for layout_key, text in (("day", day), ("day_number", f"Day {day_number}"), ("date", formatted_date)):
+        text_layout = date_layout[layout_key]
+        base_image.text(text_layout["xy"], text, font=get_font(text_layout["font"], text_layout["font_size"]),
+                        fill=base_color)
     return base_image
 
-def add_week_date_to_img(base_image: ImageDrawType, start_date: datetime) -> ImageDrawType:
+def add_week_date_to_img(base_image: PageDraw, start_date: datetime) -> PageDraw:
     """Add  week date to base image.
 
     Args:
@@ -59,31 +179,32 @@ def add_week_date_to_img(base_image: ImageDrawType, start_date: datetime) -> Ima
     formatted_start_date = start_date.strftime(date_format)
     formatted_end_date = (start_date + timedelta(days=6)).strftime(date_format)
     base_color = "black"
-    base_width = 2110
-    base_height = 65
-
-    base_image.text((base_width, base_height), f"W{week_number}", font=ImageFont.truetype(font_path, size=185), fill=base_color)
-    base_image.text((base_width + 25, base_height + 190), formatted_start_date, font=ImageFont.truetype(font_path, size=68),
-                    fill=base_color)
-    base_image.text((base_width + 25, base_height + 255), formatted_end_date, font=ImageFont.truetype(font_path, size=68),
-                    fill=base_color)
+    date_layout = get_page_layout("weekly_tasks")["date"]
+
+    for layout_key, text in (("week_number", f"W{week_number}"), ("start_date", formatted_start_date),
+                             ("end_date", formatted_end_date)):
+        text_layout = date_layout[layout_key]
+        base_image.text(text_layout["xy"], text, font=get_font(text_layout["font"], text_layout["font_size"]),
+                        fill=base_color)
     return base_image
 
 def _does_task_have_specific_time(task_date: str) -> bool:
     return task_date != "12:00am"
 
 
-def _group_tasks_by_column(tasks: list[ActiveTaskModel]) -> dict[str, list[ActiveTaskModel]]:
+def _group_tasks_by_column(tasks: list[ActiveTaskModel], task_columns: TaskColumnIds) \
+        -> dict[str, list[ActiveTaskModel]]:
     """Group tasks by column.
     
     Args:
         tasks: List of tasks to group by column.
+        task_columns: Column ids of the profile.
 
     Returns:
         Dictionary with tasks grouped by column.
     """
     BYPASS_TAGS = {"task-routine", "event"}
-    active_colum_ids = ActiveTaskColumns.get_column_ids()
+    active_colum_ids = task_columns.get_column_ids()
     grouped_tasks = {column: [] for column in active_colum_ids}	
     for task in tasks:
         if task.column in active_colum_ids:
@@ -91,14 +212,14 @@ def _group_tasks_by_column(tasks: list[ActiveTaskModel]) -> dict[str, list[Activ
 
 
         if task.tags and bool(set(task.tags) & BYPASS_TAGS):
-            grouped_tasks[ActiveTaskColumns.DAY_PERSONAL_GREAT.value].append(task)
+            grouped_tasks[task_columns.day_personal_great].append(task)
             
     return grouped_tasks
 
 
-def _add_day_tasks_group_to_img(base_image: ImageDrawType, tasks: list[ActiveTaskModel], current_height: int,
+def _add_day_tasks_group_to_img(base_image: PageDraw, tasks: list[ActiveTaskModel], current_height: int,
                                 number_tasks_left: int) \
-        -> tuple[ImageDrawType, int, int]:
+        -> tuple[PageDraw, int, int]:
     """Add day tasks group to base image.
 
     Args:
@@ -110,10 +231,10 @@ def _add_day_tasks_group_to_img(base_image: ImageDrawType, tasks: list[ActiveTas
     Returns:
         Tuple with base image with tasks added, current height of the image and number of tasks left to add.
     """
-    task_height_padding = 118.5
-    base_left_width = 2630
-    base_task_font_size = 68
-    task_font = ImageFont.truetype(font_path, size=base_task_font_size)
+    tasks_layout = get_page_layout("daily_tasks")["tasks"]
+    task_height_padding = tasks_layout["row_height"]
+    base_left_width = tasks_layout["right_x"]
+    task_font = get_font(tasks_layout["font"], tasks_layout["font_size"])
 
     for task in tasks:
         if number_tasks_left == 0:
@@ -127,9 +248,9 @@ def _add_day_tasks_group_to_img(base_image: ImageDrawType, tasks: list[ActiveTas
 
     return base_image, current_height, number_tasks_left
 
-def _add_week_tasks_group_to_img(base_image: ImageDrawType, tasks: list[ActiveTaskModel], current_height: int,
+def _add_week_tasks_group_to_img(base_image: PageDraw, tasks: list[ActiveTaskModel], current_height: int,
                                 number_tasks_left: int) \
-        -> tuple[ImageDrawType, int, int]:
+        -> tuple[PageDraw, int, int]:
     """Add week tasks group to base image.
 
     Args:
@@ -141,10 +262,10 @@ def _add_week_tasks_group_to_img(base_image: ImageDrawType, tasks: list[ActiveTa
     Returns:
         Tuple with base image with tasks added, current height of the image and number of tasks left to add.
     """
-    task_height_padding = 98
-    base_left_width = 185
-    base_task_font_size = 64
-    task_font = ImageFont.truetype(font_path, size=base_task_font_size)
+    tasks_layout = get_page_layout("weekly_tasks")["tasks"]
+    task_height_padding = tasks_layout["row_height"]
+    base_left_width = tasks_layout["left_x"]
+    task_font = get_font(tasks_layout["font"], tasks_layout["font_size"])
 
     for task in tasks:
         if number_tasks_left == 0:
@@ -157,7 +278,7 @@ def _add_week_tasks_group_to_img(base_image: ImageDrawType, tasks: list[ActiveTa
 
     return base_image, current_height, number_tasks_left
 
-def _add_day_divider_to_img(base_image: ImageDrawType, current_height: int) -> tuple[ImageDrawType, int]:
+def _add_day_divider_to_img(base_image: PageDraw, current_height: int) -> tuple[PageDraw, int]:
     """Add day divider to base image.
 
     Args:
@@ -168,18 +289,19 @@ def _add_day_divider_to_img(base_image: ImageDrawType, current_height: int) -> t
         Tuple with base image with divider added and current height of the image.
     """
     color = "black"
-    left_width = 2630
-    divider_height = 15
+    divider_layout = get_page_layout("daily_tasks")["divider"]
+    left_width = divider_layout["right_x"]
+    divider_height = divider_layout["padding"]
 
     current_height += divider_height
-    base_image.line((left_width - 2100, current_height, left_width, current_height), fill=color, width=5)
-    base_image.line((left_width - 1500, current_height, left_width, current_height), fill=color, width=8)
-    base_image.line((left_width - 1000, current_height, left_width, current_height), fill=color, width=12)
+    for line in divider_layout["lines"]:
+        base_image.line((left_width - line["length"], current_height, left_width, current_height), fill=color,
+                        width=line["width"])
     current_height += (divider_height * 2)
 
     return base_image, current_height
 
-def _add_week_divider_to_img(base_image: ImageDrawType, current_height: int) -> tuple[ImageDrawType, int]:
+def _add_week_divider_to_img(base_image: PageDraw, current_height: int) -> tuple[PageDraw, int]:
     """Add week divider to base image.
 
     Args:
@@ -190,99 +312,111 @@ def _add_week_divider_to_img(base_image: ImageDrawType, current_height: int) ->
         Tuple with base image with divider added and current height of the image.
     """
     color = "black"
-    left_width = 180
-    divider_height = 10
+    divider_layout = get_page_layout("weekly_tasks")["divider"]
+    left_width = divider_layout["left_x"]
+    divider_height = divider_layout["padding"]
 
     current_height += divider_height
-    base_image.line((left_width + 800, current_height, left_width, current_height), fill=color, width=12)
-    base_image.line((left_width + 1500, current_height, left_width, current_height), fill=color, width=8)
-    base_image.line((left_width + 1800, current_height, left_width, current_height), fill=color, width=5)
+    for line in divider_layout["lines"]:
+        base_image.line((left_width + line["length"], current_height, left_width, current_height), fill=color,
+                        width=line["width"])
     current_height += (divider_height * 2)
 
     return base_image, current_height
 
-def add_day_tasks_to_img(base_image: ImageDrawType, tasks: list[ActiveTaskModel]) -> ImageDrawType:
+def add_day_tasks_to_img(base_image: PageDraw, tasks: list[ActiveTaskModel],
+                         task_columns: TaskColumnIds = TaskColumnIds()) -> PageDraw:
     """Add day tasks to base image.
 
     Args:
         base_image: Base image to draw on.
         tasks: List of tasks to add to base image.
+        task_columns: Column ids of the profile, defaults to the ActiveTaskColumns ids.
 
     Returns:
         Base image with tasks added.
     """
     logging.info("Adding day tasks to image")
-    work_tasks_height = 455
-    personal_tasks_height = 1705
-    max_work_tasks = 9
-    max_personal_tasks = 10
+    tasks_layout = get_page_layout("daily_tasks")["tasks"]
+    work_tasks_height = tasks_layout["work_start_y"]
+    personal_tasks_height = tasks_layout["personal_start_y"]
+    max_work_tasks = tasks_layout["max_work_tasks"]
+    max_personal_tasks = tasks_layout["max_personal_tasks"]
 
-    grouped_tasks = _group_tasks_by_column(tasks)
+    grouped_tasks = _group_tasks_by_column(tasks, task_columns)
 
     base_image, work_tasks_height, max_work_tasks = _add_day_tasks_group_to_img(base_image,
-                                                                                grouped_tasks[ActiveTaskColumns.DAY_WORK_GREAT.value],
+                                                                                grouped_tasks[task_columns.day_work_great],
                                                                                 work_tasks_height,
                                                                                 max_work_tasks)
     base_image, work_tasks_height = _add_day_divider_to_img(base_image, work_tasks_height)
     base_image, work_tasks_height, _ = _add_day_tasks_group_to_img(base_image,
-                                                                   grouped_tasks[ActiveTaskColumns.DAY_WORK_AMAZING.value],
+                                                                   grouped_tasks[task_columns.day_work_amazing],
                                                                    work_tasks_height,
                                                                    max_work_tasks)
 
     base_image, personal_tasks_height, max_personal_tasks = _add_day_tasks_group_to_img(base_image,
-                                                                                        grouped_tasks[ActiveTaskColumns.DAY_PERSONAL_GREAT.value],
+                                                                                        grouped_tasks[task_columns.day_personal_great],
                                                                                         personal_tasks_height,
                                                                                         max_personal_tasks)
     base_image, personal_tasks_height = _add_day_divider_to_img(base_image, personal_tasks_height)
     base_image, personal_tasks_height, _ = _add_day_tasks_group_to_img(base_image,
-                                                                       grouped_tasks[ActiveTaskColumns.DAY_PERSONAL_AMAZING.value],
+                                                                       grouped_tasks[task_columns.day_personal_amazing],
                                                                        personal_tasks_height,
                                                                        max_personal_tasks)
 
     return base_image
 
-def add_week_tasks_to_img(base_image: ImageDrawType, tasks: list[ActiveTaskModel]) -> ImageDrawType:
+def add_week_tasks_to_img(base_image: PageDraw, tasks: list[ActiveTaskModel],
+                          task_columns: TaskColumnIds = TaskColumnIds()) -> PageDraw:
     """Add week tasks to base image.
 
     Args:
         base_image: Base image to draw on.
         tasks: List of tasks to add to base image.
+        task_columns: Column ids of the profile, defaults to the ActiveTaskColumns ids.
 
     Returns:
         Base image with tasks added.
     """
     logging.info("Adding week tasks to image")
-    work_tasks_height = 110
-    personal_tasks_height = 1020
-    max_work_tasks = 8
-    max_personal_tasks = 8
+    tasks_layout = get_page_layout("weekly_tasks")["tasks"]
+    work_tasks_height = tasks_layout["work_start_y"]
+    personal_tasks_height = tasks_layout["personal_start_y"]
+    max_work_tasks = tasks_layout["max_work_tasks"]
+    max_personal_tasks = tasks_layout["max_personal_tasks"]
 
-    grouped_tasks = _group_tasks_by_column(tasks)
+    grouped_tasks = _group_tasks_by_column(tasks, task_columns)
 
     base_image, work_tasks_height, max_work_tasks = _add_week_tasks_group_to_img(base_image,
-                                                                                 grouped_tasks[ActiveTaskColumns.WEEK_WORK_GREAT.value],
+                                                                                 grouped_tasks[task_columns.week_work_great],
                                                                                  work_tasks_height,
                                                                                  max_work_tasks)
     base_image, work_tasks_height = _add_week_divider_to_img(base_image, work_tasks_height)
     base_image, work_tasks_height, _ = _add_week_tasks_group_to_img(base_image,
-                                                                   grouped_tasks[ActiveTaskColumns.WEEK_WORK_AMAZING.value],
+                                                                   grouped_tasks[task_columns.week_work_amazing],
                                                                    work_tasks_height,
                                                                    max_work_tasks)
 
     base_image, personal_tasks_height, max_personal_tasks = _add_week_tasks_group_to_img(base_image,
-                                                                                        grouped_tasks[ActiveTaskColumns.WEEK_PERSONAL_GREAT.value],
+                                                                                        grouped_tasks[task_columns.week_personal_great],
                                                                                         personal_tasks_height,
                                                                                         max_personal_tasks)
     base_image, personal_tasks_height = _add_week_divider_to_img(base_image, personal_tasks_height)
     base_image, personal_tasks_height, _ = _add_week_tasks_group_to_img(base_image,
-                                                                       grouped_tasks[ActiveTaskColumns.WEEK_PERSONAL_AMAZING.value],
+                                                                       grouped_tasks[task_columns.week_personal_amazing],
                                                                        personal_tasks_height,
                                                                        max_personal_tasks)
 
     return base_image
 
-async def get_weather_forecast(timeout: int):
-    """Get weather forecast for Quebec City.
+async def get_weather_forecast(timeout: int, location: str = WEATHER_LOCATION, session: ClientSession | None = None):
+    """Get weather forecast for a location.
+
+    Args:
+        timeout: Maximum seconds to wait for the forecast.
+        location: Location of the forecast, defaults to Quebec City.
+        session: aiohttp session used by the weather client, by default the client opens and closes its own.
 
     Returns:
         Generator of weather forecasts.
@@ -290,9 +424,9 @@ async def get_weather_forecast(timeout: int):
 
     async def getweather():
         # declare the client. the measuring unit used defaults to the metric system (celcius, km/h, etc.)
-        async with python_weather.Client(unit=python_weather.METRIC) as client:
+        async with python_weather.Client(unit=python_weather.METRIC, session=session) as client:
             # fetch a weather forecast from a city
-            weather = await client.get("Quebec City")
+            weather = await client.get(location)
         return weather.forecasts
 
     return await asyncio.wait_for(getweather(), timeout=timeout)
@@ -317,86 +451,105 @@ def get_weather_icon(forecast_kind: Kind, forecast_time: int) -> ImageType:
             if forecast_time >= 18:
                 icon_path = "designs/weather_icons/night.png"
 
+    asset_pack = get_asset_pack()
+    if asset_pack is not None and asset_pack.has_image(icon_path):
+        return asset_pack.get_image(icon_path)
     return Image.open(icon_path)
 
 
-def add_weather_to_img(base_image: ImageDrawType, date: datetime) -> ImageDrawType:
-    try:
-        date_forecast = next((fc for fc in asyncio.run(get_weather_forecast(timeout=10)) if fc.date == date.date()),
-                             None)
-    except (ClientConnectorError, asyncio.TimeoutError, ServerDisconnectedError):
-        logging.warning("Could not connect to weather API")
-        date_forecast = None
+def add_weather_to_img(base_image: PageDraw, hourly_forecasts: list[HourlyForecastModel]) -> PageDraw:
+    """Add the temperature, feels like temperature and weather icon of the layout hours.
 
-    if date_forecast is None:
-        return base_image
+    Args:
+        base_image: Base image to draw on.
+        hourly_forecasts: Forecasts of the hours of the day, hours missing from the layout are skipped.
+
+    Returns:
+        Base image with the weather added.
+    """
+    weather_layout = get_page_layout("daily_tasks")["weather"]
+    temperature_x, temperature_y = weather_layout["temperature_xy"]
+    feels_like_x, feels_like_y = weather_layout["feels_like_xy"]
+    icon_x, icon_y = weather_layout["icon_xy"]
+    temperature_font = get_font(weather_layout["font"], weather_layout["font_size"])
 
     forcast_padding = 0
-    for hour_forecast in date_forecast.hourly:
-        forecast_time = hour_forecast.time.hour
-        if forecast_time not in [6, 9, 12, 15, 18, 21]:
+    for hour_forecast in hourly_forecasts:
+        forecast_time = hour_forecast.hour
+        if forecast_time not in weather_layout["hours"]:
             continue
 
-        temperature_font = ImageFont.truetype(font_path, size=60)
         forecast_temperature = str(hour_forecast.temperature) + "°"
-        base_image.text((1959 + forcast_padding, 349), forecast_temperature,
+        base_image.text((temperature_x + forcast_padding, temperature_y), forecast_temperature,
                         font=temperature_font, fill="black", anchor="mm")
 
         forecast_feels_like = str(hour_forecast.feels_like) + "°"
-        base_image.text((1959 + forcast_padding, 424), forecast_feels_like,
+        base_image.text((feels_like_x + forcast_padding, feels_like_y), forecast_feels_like,
                         font=temperature_font, fill="black", anchor="mm")
 
-        forecast_kind = hour_forecast.kind
-        forecast_kind_icon = get_weather_icon(forecast_kind, forecast_time)
-        base_image._image.paste(forecast_kind_icon, (1912 + forcast_padding, 199), forecast_kind_icon)
+        forecast_kind_icon = get_weather_icon(Kind[hour_forecast.kind], forecast_time)
+        base_image.paste(forecast_kind_icon, (icon_x + forcast_padding, icon_y), forecast_kind_icon)
 
-        forcast_padding += 138
+        forcast_padding += weather_layout["column_width"]
 
     return base_image
 
 
-def add_logs_to_img(base_image: ImageDrawType, logs: List[str]) -> ImageDrawType:
-    logging.info("Adding logs to image")
-    current_height = 1770
-    task_padding = 90
+def add_logs_to_img(base_image: PageDraw, logs: Iterator[str],
+                    layout_name: str = "logs_continuation") -> PageDraw:
+    """Add logs to base image, one per row until the rows of the layout are full.
 
-    for log in logs:
-        task_font_path = font_path
-        if log.startswith(" щ"):
-            task_font_path = bold_font_path
+    Args:
+        base_image: Base image to draw on.
+        logs: Logs to add, only the logs that fit in the page are consumed.
+        layout_name: Name of the page layout with the logs section.
 
-        task_font = ImageFont.truetype(task_font_path, size=60)
-        base_image.text((350, current_height), log, font=task_font, fill="black")
-        current_height += task_padding
+    Returns:
+        Base image with logs added.
+    """
+    logging.info("Adding logs to image")
+    logs_layout = get_page_layout(layout_name)["logs"]
+    log_font = get_font(logs_layout["font"], logs_layout["font_size"])
+    highlight_font = get_font(logs_layout["highlight_font"], logs_layout["font_size"])
+
+    for row, log in enumerate(islice(logs, logs_layout["max_rows"])):
+        current_height = logs_layout["start_y"] + row * logs_layout["row_height"]
+        base_image.text((logs_layout["x"], current_height), log,
+                        font=highlight_font if log.startswith(" щ") else log_font, fill="black")
 
     return base_image
 
 
-def add_date_to_logs_img(base_image: ImageDrawType, date: datetime) -> ImageDrawType:
+def add_date_to_logs_img(base_image: PageDraw, date: datetime, layout_name: str = "logs") -> PageDraw:
     """Add date to base image.
 
     Args:
         base_image: Base image to draw on.
         date: Date to add to base image in format dd-mmm.
+        layout_name: Name of the page layout with the date section.
 
     Returns:
         Base image with date added.
     """
     logging.info(f"Adding date {date} to logs image")
     formatted_date = date.strftime("%d-%b-%Y")
-    base_image.text((2320, 120), formatted_date, font=ImageFont.truetype(font_path, size=58), fill="black")
+    date_layout = get_page_layout(layout_name)["date"]
+    base_image.text(date_layout["xy"], formatted_date, font=get_font(date_layout["font"], date_layout["font_size"]),
+                    fill="black")
     return base_image
 
 
-def add_stats_to_img(base_image: ImageDrawType, stats: PersonalStats) -> ImageDrawType:
-    print_stats: list[tuple[float, tuple[int, int]]] = [(stats.work_time, (770, 140)),
-                                                        (stats.focus_time, (1040, 140)),
-                                                        (stats.sleep_time, (770, 268)),
-                                                        (stats.leisure_time, (1040, 268))]
+def add_stats_to_img(base_image: PageDraw, stats: PersonalStats) -> PageDraw:
+    stats_layout = get_page_layout("stats")["stats"]
+    stats_font = get_font(stats_layout["font"], stats_layout["font_size"])
+    print_stats: list[tuple[float, tuple[int, int]]] = [(stats.work_time, stats_layout["work_time_xy"]),
+                                                        (stats.focus_time, stats_layout["focus_time_xy"]),
+                                                        (stats.sleep_time, stats_layout["sleep_time_xy"]),
+                                                        (stats.leisure_time, stats_layout["leisure_time_xy"])]
 
     for stat, position in print_stats:
         if stat > 0:
-            base_image.text(position, str(round(stat, 1)), font=ImageFont.truetype(font_path, size=59), fill="black")
+            base_image.text(position, str(round(stat, 1)), font=stats_font, fill="black")
 
     return base_image
 
@@ -418,16 +571,162 @@ def _generate_qr_code(url: str, size_in_cm: float, dpi: int) -> ImageType:
     return qr_img.resize((size_in_pixels, size_in_pixels))
 
 
-def add_journal_qr_to_img(base_image: ImageType, journal_url: str) -> ImageType:
-    qr_code_img = _generate_qr_code(journal_url, 1, 700)
-    base_image.paste(qr_code_img, (1500, 140))
+def add_journal_qr_to_img(base_image: PageDraw, journal_url: str) -> PageDraw:
+    qr_layout = get_page_layout("stats")["journal_qr"]
+    qr_code_img = _generate_qr_code(journal_url, qr_layout["size_in_cm"], qr_layout["dpi"])
+    base_image.paste(qr_code_img, qr_layout["xy"])
 
     return base_image
 
 
-def add_journal_summary_to_img(base_image: ImageDrawType, thoughts: str) -> ImageDrawType:
+def paste_overlay_ink(base_image: ImageType, overlay: ImageType) -> ImageType:
+    """Paste the ink of an overlay page on top of a base page, white pixels are treated as transparent.
+
+    The overlay is converted to grayscale once, the ink bounding box is found with NumPy and only that region is
+    pasted, using the inverted grayscale of the region as mask.
+
+    Args:
+        base_image: Base page to paste on, it's modified in place.
+        overlay: Page with the same size as the base page whose ink is pasted.
+
+    Returns:
+        Base page with the overlay ink pasted.
+    """
+    overlay_gray = np.asarray(overlay.convert("L"))
+    ink_rows = np.flatnonzero((overlay_gray < 255).any(axis=1))
+    if ink_rows.size == 0:
+        return base_image
+
+    top, bottom = ink_rows[0], ink_rows[-1] + 1
+    ink_columns = np.flatnonzero((overlay_gray[top:bottom] < 255).any(axis=0))
+    left, right = ink_columns[0], ink_columns[-1] + 1
+
+    ink_mask = Image.fromarray(255 - overlay_gray[top:bottom, left:right], mode="L")
+    ink_box = (int(left), int(top), int(right), int(bottom))
+    base_image.paste(overlay.crop(ink_box), ink_box, mask=ink_mask)
+
+    return base_image
+
+
+def add_journal_summary_to_img(base_image: PageDraw, thoughts: str) -> PageDraw:
     logging.info("Adding thoughts to image")
-    thoughts = "\n".join(thoughts.split("\n")[:21])
-    base_image.text((135, 2156), thoughts, font=ImageFont.truetype(font_path, size=59), spacing=8, fill="black")
+    summary_layout = get_page_layout("recap")["summary"]
+    thoughts = "\n".join(thoughts.split("\n")[:summary_layout["max_lines"]])
+    base_image.text(summary_layout["xy"], thoughts, font=get_font(summary_layout["font"], summary_layout["font_size"]),
+                    spacing=summary_layout["spacing"], fill="black")
+
+    return base_image
+
+
+def _add_stat_heatmap_to_img(base_image: PageDraw, daily_values: np.ndarray, first_weekday: int,
+                             origin: tuple[int, int]) -> PageDraw:
+    """Add a calendar heatmap of a stat, one column per week and one row per weekday.
+
+    Args:
+        base_image: Base image to draw on.
+        daily_values: Stat per day with NaN for the days without stats.
+        first_weekday: Weekday of the first day, monday is 0.
+        origin: Upper left corner of the heatmap.
+
+    Returns:
+        Base image with the heatmap added.
+    """
+    heatmap_layout = get_page_layout("stats_summary")["heatmap"]
+    cell_step = heatmap_layout["cell_size"] + heatmap_layout["cell_gap"]
+
+    calendar_positions = first_weekday + np.arange(daily_values.size)
+    cells_x = origin[0] + (calendar_positions // 7) * cell_step
+    cells_y = origin[1] + (calendar_positions % 7) * cell_step
+
+    max_value = np.nanmax(daily_values) if np.any(daily_values > 0) else 1
+    intensities = np.nan_to_num(daily_values) / max_value
+    light_gray, dark_gray = heatmap_layout["light_gray"], heatmap_layout["dark_gray"]
+    cells_gray = np.rint(light_gray - intensities * (light_gray - dark_gray)).astype(int)
+
+    for cell_x, cell_y, cell_gray, value in zip(cells_x.tolist(), cells_y.tolist(), cells_gray.tolist(),
+                                                daily_values.tolist()):
+        cell_box = (cell_x, cell_y, cell_x + heatmap_layout["cell_size"], cell_y + heatmap_layout["cell_size"])
+        if np.isnan(value):
+            base_image.rectangle(cell_box, outline=heatmap_layout["empty_outline"], width=2)
+        else:
+            base_image.rectangle(cell_box, fill=f"#{cell_gray:02x}{cell_gray:02x}{cell_gray:02x}")
+
+    return base_image
+
+
+def _add_stat_sparkline_to_img(base_image: PageDraw, rolling_means: np.ndarray, origin: tuple[int, int],
+                               width: int) -> PageDraw:
+    """Add a sparkline with the rolling average of a stat.
+
+    Args:
+        base_image: Base image to draw on.
+        rolling_means: Rolling average per day with NaN for the days without stats.
+        origin: Upper left corner of the sparkline.
+        width: Width of the sparkline.
+
+    Returns:
+        Base image with the sparkline added.
+    """
+    sparkline_layout = get_page_layout("stats_summary")["sparkline"]
+    if rolling_means.size < 2 or np.all(np.isnan(rolling_means)):
+        return base_image
+
+    min_value, max_value = np.nanmin(rolling_means), np.nanmax(rolling_means)
+    if max_value > min_value:
+        normalized_means = (np.nan_to_num(rolling_means, nan=min_value) - min_value) / (max_value - min_value)
+    else:
+        # A constant stat has no range to scale, it's drawn along the middle of the sparkline
+        normalized_means = np.full(rolling_means.shape, 0.5)
+    points_x = origin[0] + np.linspace(0, width, rolling_means.size)
+    points_y = origin[1] + sparkline_layout["height"] * (1 - normalized_means)
+    points = np.column_stack((points_x, points_y)).ravel().tolist()
+
+    base_image.line(tuple(points), fill="black", width=sparkline_layout["line_width"])
+    return base_image
+
+
+def add_stats_summary_to_img(base_image: PageDraw, summary: StatsSummary, title: str) -> PageDraw:
+    """Add the heatmap, sparkline and aggregated values of every stat to a summary page.
+
+    Args:
+        base_image: Base image to draw on.
+        summary: Aggregated stats of the summary range.
+        title: Title of the page.
+
+    Returns:
+        Base image with the stats summary added.
+    """
+    logging.info(f"Adding stats summary {title} to image")
+    summary_layout = get_page_layout("stats_summary")
+    title_layout = summary_layout["title"]
+    section_layout = summary_layout["section"]
+    label_layout = summary_layout["label"]
+    text_layout = summary_layout["summary"]
+
+    base_image.text(title_layout["xy"], title, font=get_font(title_layout["font"], title_layout["font_size"]),
+                    fill="black")
+
+    weekday_names = ("Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun")
+    section_x = section_layout["x"]
+    for stat_index, stat_name in enumerate(STAT_NAMES):
+        section_y = section_layout["start_y"] + stat_index * section_layout["height"]
+        stat_label = stat_name.replace("_", " ").capitalize()
+        base_image.text((section_x, section_y), stat_label,
+                        font=get_font(label_layout["font"], label_layout["font_size"]), fill="black")
+
+        _add_stat_heatmap_to_img(base_image, summary.daily_values[:, stat_index], summary.start_date.weekday(),
+                                 (section_x, section_y + summary_layout["heatmap"]["offset_y"]))
+        _add_stat_sparkline_to_img(base_image, summary.rolling_means[:, stat_index],
+                                   (section_x, section_y + summary_layout["sparkline"]["offset_y"]),
+                                   section_layout["width"])
+
+        weekday_means = np.nan_to_num(summary.weekday_means[:, stat_index])
+        best_weekday = weekday_names[int(np.argmax(weekday_means))]
+        stat_summary = (f"Avg {np.nan_to_num(summary.means[stat_index]):.1f}h | "
+                        f"Total {summary.totals[stat_index]:.0f}h | "
+                        f"Best day {best_weekday} {weekday_means.max():.1f}h | "
+                        f"Streak {summary.longest_streaks[stat_index]}d (now {summary.current_streaks[stat_index]}d)")
+        base_image.text((section_x, section_y + text_layout["offset_y"]), stat_summary,
+                        font=get_font(text_layout["font"], text_layout["font_size"]), fill="black")
 
     return base_image
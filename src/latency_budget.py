@@ -0,0 +1,81 @@
+import json
+import logging
+import os
+import threading
+from concurrent import futures
+from typing import Any, Callable, TypeVar
+
+from attr import asdict
+
+from config import LAST_KNOWN_DATA_FILE
+
+T = TypeVar("T")
+
+
+def run_with_budget(function: Callable[[], T], budget_seconds: float) -> T:
+    """Run a function and wait for it at most the budget.
+
+    The function runs in a daemon thread, when the budget runs out the thread is left behind so it can't delay the
+    page or the exit of the process.
+
+    Args:
+        function: Function to run.
+        budget_seconds: Maximum seconds to wait for the result.
+
+    Returns:
+        Result of the function.
+
+    Raises:
+        TimeoutError: If the function didn't finish within the budget.
+    """
+    result_future: futures.Future = futures.Future()
+
+    def run_function():
+        try:
+            result_future.set_result(function())
+        except Exception as error:
+            result_future.set_exception(error)
+
+    threading.Thread(target=run_function, daemon=True).start()
+    try:
+        return result_future.result(timeout=budget_seconds)
+    except futures.TimeoutError:
+        raise TimeoutError(f"Not finished within {budget_seconds} seconds") from None
+
+
+class LastKnownData:
+    """Last data fetched successfully from every source, persisted so the next run can fall back to it.
+
+    Values are stored as JSON, attrs instances are stored as dictionaries and decoded by the caller.
+    """
+
+    def __init__(self, data_file: str = LAST_KNOWN_DATA_FILE):
+        self.data_file = data_file
+        self._lock = threading.Lock()
+        self._data: dict[str, dict[str, Any]] = self._load_data()
+
+    def _load_data(self) -> dict[str, dict[str, Any]]:
+        if not os.path.exists(self.data_file):
+            return {}
+
+        try:
+            with open(self.data_file, encoding="utf-8") as data_file:
+                return json.load(data_file)
+        except (OSError, json.JSONDecodeError):
+            logging.warning(f"Could not read last known data {self.data_file}, ignoring it")
+            return {}
+
+    def get(self, source: str, key: str) -> Any | None:
+        with self._lock:
+            return self._data.get(source, {}).get(key)
+
+    def set(self, source: str, key: str, value: Any):
+        raw_value = json.loads(json.dumps(value, default=asdict))
+        with self._lock:
+            if self._data.get(source, {}).get(key) == raw_value:
+                return
+
+            self._data.setdefault(source, {})[key] = raw_value
+            os.makedirs(os.path.dirname(self.data_file) or ".", exist_ok=True)
+            with open(self.data_file, "w", encoding="utf-8") as data_file:
+                json.dump(self._data, data_file, indent=2)
@@ -0,0 +1,163 @@
+import io
+import json
+import logging
+import os
+import re
+from datetime import datetime
+
+from PIL import Image
+from PIL.Image import Image as ImageType
+
+from config import OLD_PAGES_FOLDER, OLD_PAGES_ARCHIVE_FILE, OLD_PAGES_INDEX_FILE
+
+archive_date_format = "%Y-%m-%d"
+old_page_file_pattern = re.compile(r"^(\d{2}-[a-z]{3}-\d{4})-old-(task|journal|recap)-page\.png$")
+
+
+class PageArchive:
+    """Indexed archive with the old bitacora pages.
+
+    Every page is thresholded to bilevel and stored as a CCITT Group 4 TIFF in a single data file, which takes a
+    fraction of the space of a grayscale PNG for scanned pages. The index file maps each date and page kind to the
+    position of its TIFF, so a single page can be decoded without reading the rest of the archive.
+    """
+    PAGE_KINDS = ("task", "journal", "recap")
+
+    def __init__(self, archive_file: str = OLD_PAGES_ARCHIVE_FILE, index_file: str = OLD_PAGES_INDEX_FILE):
+        self.archive_file = archive_file
+        self.index_file = index_file
+        self._index: dict[str, dict[str, dict]] = self._load_index()
+
+    def _load_index(self) -> dict[str, dict[str, dict]]:
+        if not os.path.exists(self.index_file):
+            return {}
+
+        with open(self.index_file, encoding="utf-8") as index_file:
+            return json.load(index_file)
+
+    def _save_index(self):
+        """Write the index to a temporary file and replace the old one, so a crash never leaves a partial index."""
+        temporary_index_file = f"{self.index_file}.tmp"
+        with open(temporary_index_file, "w", encoding="utf-8") as index_file:
+            json.dump(self._index, index_file, indent=2, sort_keys=True)
+        os.replace(temporary_index_file, self.index_file)
+
+    def get_dates(self) -> list[datetime]:
+        """Get the dates stored in the archive.
+
+        Returns:
+            List of archived dates in chronological order.
+        """
+        return [datetime.strptime(date, archive_date_format) for date in sorted(self._index)]
+
+    def has_page(self, date: datetime, page_kind: str) -> bool:
+        return page_kind in self._index.get(date.strftime(archive_date_format), {})
+
+    @staticmethod
+    def convert_page(page: ImageType) -> ImageType:
+        """Convert a page to bilevel, thresholded at the middle gray instead of dithered."""
+        return page.convert("L").point(lambda pixel_value: 255 if pixel_value >= 128 else 0, mode="1")
+
+    def add_page(self, date: datetime, page_kind: str, page: ImageType):
+        """Append a page to the archive and save the index, replacing the index entry if the page was already archived.
+
+        The index is saved after every page, so an interrupted migration keeps the pages archived until then and can
+        be resumed.
+
+        Args:
+            date: Date of the page.
+            page_kind: Kind of the page, one of PAGE_KINDS.
+            page: Page to archive.
+        """
+        if page_kind not in self.PAGE_KINDS:
+            raise ValueError(f"Invalid page kind {page_kind}, valid kinds are {self.PAGE_KINDS}")
+
+        tiff_buffer = io.BytesIO()
+        self.convert_page(page).save(tiff_buffer, "TIFF", compression="group4")
+        page_tiff = tiff_buffer.getvalue()
+
+        os.makedirs(os.path.dirname(self.archive_file) or ".", exist_ok=True)
+        with open(self.archive_file, "ab") as archive_file:
+            page_offset = archive_file.tell()
+            archive_file.write(page_tiff)
+
+        page_entry = {"offset": page_offset, "length": len(page_tiff)}
+        self._index.setdefault(date.strftime(archive_date_format), {})[page_kind] = page_entry
+        self._save_index()
+
+    def load_page(self, date: datetime, page_kind: str) -> ImageType:
+        """Load and decode a single page from the archive.
+
+        Args:
+            date: Date of the page.
+            page_kind: Kind of the page, one of PAGE_KINDS.
+
+        Returns:
+            Image object with the bilevel page.
+        """
+        page_entry = self._index.get(date.strftime(archive_date_format), {}).get(page_kind)
+        if page_entry is None:
+            raise FileNotFoundError(f"Page {page_kind} for date {date} not found in {self.archive_file}")
+
+        with open(self.archive_file, "rb") as archive_file:
+            archive_file.seek(page_entry["offset"])
+            page_data = archive_file.read(page_entry["length"])
+
+        with Image.open(io.BytesIO(page_data)) as page:
+            page.load()
+            return page
+
+    def is_page_archived(self, date: datetime, page_kind: str, page: ImageType) -> bool:
+        """Check that the archived page decodes to the same pixels as the given page converted to bilevel.
+
+        Args:
+            date: Date of the page.
+            page_kind: Kind of the page, one of PAGE_KINDS.
+            page: Original page.
+
+        Returns:
+            True if the page is archived and its pixels are the same.
+        """
+        if not self.has_page(date, page_kind):
+            return False
+
+        archived_page = self.load_page(date, page_kind)
+        original_page = self.convert_page(page)
+        return archived_page.size == original_page.size and archived_page.tobytes() == original_page.tobytes()
+
+
+def migrate_old_pages_folder(old_pages_folder: str = OLD_PAGES_FOLDER,
+                             page_archive: PageArchive | None = None) -> list[str]:
+    """Move the loose old pages PNGs into the page archive, checking that every archived page round-trips.
+
+    The pages already in the archive are skipped, so an interrupted migration continues where it stopped.
+
+    Args:
+        old_pages_folder: Folder with the old pages named dd-mmm-yyyy-old-<kind>-page.png.
+        page_archive: Archive where the pages are moved. Defaults to the archive in the old pages folder.
+
+    Returns:
+        Paths of the PNGs whose pages are archived with the same pixels, only these can be deleted.
+    """
+    page_archive = page_archive or PageArchive()
+    verified_files = []
+
+    for filename in sorted(os.listdir(old_pages_folder)):
+        file_match = old_page_file_pattern.match(filename)
+        if file_match is None:
+            continue
+
+        page_date = datetime.strptime(file_match.group(1), "%d-%b-%Y")
+        page_kind = file_match.group(2)
+        page_path = os.path.join(old_pages_folder, filename)
+        with Image.open(page_path) as page:
+            if not page_archive.has_page(page_date, page_kind):
+                logging.info(f"Archiving {filename}")
+                page_archive.add_page(page_date, page_kind, page)
+
+            if page_archive.is_page_archived(page_date, page_kind, page):
+                verified_files.append(page_path)
+            else:
+                logging.error(f"The archived page of {filename} is different from the PNG, keep the PNG")
+
+    return verified_files
@@ -0,0 +1,45 @@
+import json
+from functools import lru_cache
+from typing import Any
+
+from config import LAYOUTS_FOLDER
+
+layout_fonts = {"regular": "fonts/RobotoMono-Regular.ttf",
+                "bold": "fonts/RobotoMono-Bold.ttf"}
+
+
+def _compile_layout_value(key: str, value: Any) -> Any:
+    """Compile a layout value, lists become tuples and font names are resolved to font files.
+
+    Args:
+        key: Key of the value in the layout file.
+        value: Raw value read from the layout file.
+
+    Returns:
+        Compiled value.
+    """
+    if isinstance(value, dict):
+        return {item_key: _compile_layout_value(item_key, item) for item_key, item in value.items()}
+    if isinstance(value, list):
+        return tuple(_compile_layout_value(key, item) for item in value)
+    if key.endswith("font"):
+        if value not in layout_fonts:
+            raise ValueError(f"Invalid font {value}, valid fonts are {tuple(layout_fonts)}")
+        return layout_fonts[value]
+    return value
+
+
+@lru_cache(maxsize=None)
+def get_page_layout(layout_name: str) -> dict[str, Any]:
+    """Get the compiled layout of a page template, layouts are read from LAYOUTS_FOLDER once per run.
+
+    Args:
+        layout_name: Name of the layout file without extension.
+
+    Returns:
+        Dictionary with the template path and the positions, fonts and sizes of every page section.
+    """
+    with open(f"{LAYOUTS_FOLDER}/{layout_name}.json", encoding="utf-8") as layout_file:
+        raw_layout = json.load(layout_file)
+
+    return _compile_layout_value(layout_name, raw_layout)
@@ -0,0 +1,213 @@
+import hashlib
+import json
+import logging
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from enum import Enum
+from functools import lru_cache
+
+import numpy as np
+from attr import define, field
+from PIL.Image import Image as ImageType
+
+from config import LAYOUTS_FOLDER, PRINTED_PAGES_FILE
+from src.image_processor import open_template
+from src.page_layout import get_page_layout
+
+_printed_pages_lock = threading.Lock()
+
+
+class PreflightAction(Enum):
+    """Valid actions for the pages that fail a preflight check."""
+    KEEP = "keep"
+    FLAG = "flag"
+    DROP = "drop"
+
+
+@define(frozen=True)
+class PreflightPolicy:
+    """What to do with blank, duplicated and already printed pages, every check only flags the pages by default.
+
+    Empty pages and template backs are blank on purpose, so dropping pages has to be asked for explicitly.
+
+    Attributes:
+        blank_action: Action for the pages without content beyond their template.
+        duplicate_action: Action for the pages equal to a previous page of the same batch.
+        printed_action: Action for the pages equal to a page printed in a previous batch.
+        max_blank_change: Maximum fraction of changed pixels, outside the layout ignore boxes, of a blank page.
+        min_ink_coverage: Pages with this fraction of ink or less are blank even without a template, e.g. white pages.
+        reduce_factor: Factor by which the pages are reduced before checking them.
+    """
+    blank_action: PreflightAction = PreflightAction.FLAG
+    duplicate_action: PreflightAction = PreflightAction.FLAG
+    printed_action: PreflightAction = PreflightAction.FLAG
+    max_blank_change: float = 0.00005
+    min_ink_coverage: float = 0.0
+    reduce_factor: int = 4
+
+
+@define
+class PageCheck:
+    """Preflight result of a page, page numbers start at 1."""
+    page_number: int
+    page_hash: str
+    ink_coverage: float
+    template_change: float | None = None
+    duplicate_of: int | None = None
+    printed_as: str | None = None
+    is_blank: bool = False
+    action: PreflightAction = PreflightAction.KEEP
+
+
+@define
+class PreflightReport:
+    checks: list[PageCheck] = field(factory=list)
+
+    def format(self) -> str:
+        """Format the report as a table with one row per page."""
+        report_lines = [f"{'page':>4}  {'ink':>6}  {'changed':>8}  {'action':<6}  notes"]
+        for check in self.checks:
+            notes = []
+            if check.is_blank:
+                notes.append("blank")
+            if check.duplicate_of is not None:
+                notes.append(f"duplicate of page {check.duplicate_of}")
+            if check.printed_as is not None:
+                notes.append(f"printed in {check.printed_as}")
+
+            template_change = "-" if check.template_change is None else f"{check.template_change:.4%}"
+            report_lines.append(f"{check.page_number:>4}  {check.ink_coverage:>6.1%}  {template_change:>8}  "
+                                f"{check.action.value:<6}  {', '.join(notes)}")
+
+        return "\n".join(report_lines)
+
+
+@lru_cache(maxsize=None)
+def _get_template_ignore_boxes(template_path: str) -> tuple[tuple[int, int, int, int], ...]:
+    """Get the boxes of a template that change on every page, like the date, from the layouts preflight section."""
+    for layout_file in sorted(os.listdir(LAYOUTS_FOLDER)):
+        page_layout = get_page_layout(layout_file.removesuffix(".json"))
+        if page_layout["template"] == template_path and "preflight" in page_layout:
+            return page_layout["preflight"]["ignore_boxes"]
+
+    return ()
+
+
+@lru_cache(maxsize=None)
+def _get_template_check_data(template_path: str, scale: float, reduce_factor: int) -> tuple[np.ndarray, np.ndarray]:
+    """Get the reduced grayscale pixels of a template and the mask of the pixels compared with the pages."""
+    template_pixels = _get_check_pixels(open_template(template_path, scale), reduce_factor)
+
+    compared_pixels = np.ones(template_pixels.shape, dtype=bool)
+    box_scale = scale / reduce_factor
+    for x0, y0, x1, y1 in _get_template_ignore_boxes(template_path):
+        compared_pixels[int(y0 * box_scale):int(np.ceil(y1 * box_scale)),
+                        int(x0 * box_scale):int(np.ceil(x1 * box_scale))] = False
+
+    return template_pixels, compared_pixels
+
+
+def _get_check_pixels(page: ImageType, reduce_factor: int) -> np.ndarray:
+    if page.mode not in ("L", "RGB"):
+        page = page.convert("L")
+    return np.asarray(page.reduce(reduce_factor).convert("L"))
+
+
+def _load_printed_pages(printed_pages_file: str) -> dict[str, str]:
+    if not os.path.exists(printed_pages_file):
+        return {}
+
+    try:
+        with open(printed_pages_file, encoding="utf-8") as printed_pages:
+            return json.load(printed_pages)
+    except (OSError, json.JSONDecodeError):
+        logging.warning(f"Could not read printed pages {printed_pages_file}, ignoring it")
+        return {}
+
+
+def record_printed_pages(report: PreflightReport, pdf_title: str, printed_pages_file: str = PRINTED_PAGES_FILE):
+    """Remember the hashes of the pages with content that were saved, so later batches can detect reprints.
+
+    Args:
+        report: Report of the preflight of the saved pages.
+        pdf_title: Title of the PDF where the pages were saved.
+        printed_pages_file: File with the hashes of the printed pages.
+    """
+    new_hashes = {check.page_hash: pdf_title for check in report.checks
+                  if check.action != PreflightAction.DROP and check.template_change is not None}
+    if not new_hashes:
+        return
+
+    with _printed_pages_lock:
+        printed_pages = _load_printed_pages(printed_pages_file)
+        printed_pages.update({page_hash: title for page_hash, title in new_hashes.items()
+                              if page_hash not in printed_pages})
+
+        os.makedirs(os.path.dirname(printed_pages_file) or ".", exist_ok=True)
+        with open(printed_pages_file, "w", encoding="utf-8") as printed_pages_output:
+            json.dump(printed_pages, printed_pages_output, indent=2)
+
+
+def preflight_pages(pages: list[ImageType], policy: PreflightPolicy = PreflightPolicy(),
+                    printed_pages_file: str = PRINTED_PAGES_FILE) -> tuple[list[ImageType], PreflightReport]:
+    """Check a batch of pages before saving it, dropping or flagging the blank and duplicated pages.
+
+    Every page is reduced to grayscale once, in a thread pool since Pillow releases the GIL, then its ink coverage and
+    hash are computed with NumPy and, for pages rendered from a display list, it's compared with its template outside
+    the layout ignore boxes. Only pages rendered from a display list are compared with the pages printed before, the
+    reflection pages are the same every day. Pages with degraded sections are never blank.
+
+    Args:
+        pages: Pages of the batch in order.
+        policy: Actions and thresholds of the checks.
+        printed_pages_file: File with the hashes of the printed pages.
+
+    Returns:
+        Tuple with the pages to save and the report of every page.
+    """
+    printed_pages = _load_printed_pages(printed_pages_file)
+    first_page_numbers: dict[str, int] = {}
+    report = PreflightReport()
+    kept_pages = []
+
+    with ThreadPoolExecutor() as executor:
+        pages_pixels = list(executor.map(_get_check_pixels, pages, [policy.reduce_factor] * len(pages)))
+
+    for page_number, (page, page_pixels) in enumerate(zip(pages, pages_pixels), start=1):
+        page_hash = hashlib.blake2b(page_pixels.tobytes() + str(page_pixels.shape).encode(), digest_size=16).hexdigest()
+        check = PageCheck(page_number=page_number, page_hash=page_hash,
+                          ink_coverage=float(np.count_nonzero(page_pixels < 128)) / page_pixels.size)
+
+        template_path = page.info.get("template")
+        if template_path is not None:
+            template_pixels, compared_pixels = _get_template_check_data(template_path, page.info.get("scale", 1),
+                                                                        policy.reduce_factor)
+            if template_pixels.shape == page_pixels.shape:
+                changed_pixels = (np.abs(page_pixels.astype(np.int16) - template_pixels) > 32) & compared_pixels
+                check.template_change = float(np.count_nonzero(changed_pixels)) / page_pixels.size
+            check.printed_as = printed_pages.get(page_hash)
+
+        # A page with degraded sections can look blank because its data is missing, it's printed anyway
+        check.is_blank = (not page.info.get("degraded_sections")
+                          and (check.ink_coverage <= policy.min_ink_coverage
+                               or (check.template_change is not None
+                                   and check.template_change <= policy.max_blank_change)))
+        first_page_number = first_page_numbers.setdefault(page_hash, page_number)
+        if first_page_number != page_number:
+            check.duplicate_of = first_page_number
+
+        failed_actions = [action for action, has_failed in ((policy.blank_action, check.is_blank),
+                                                            (policy.duplicate_action, check.duplicate_of is not None),
+                                                            (policy.printed_action, check.printed_as is not None))
+                          if has_failed]
+        if PreflightAction.DROP in failed_actions:
+            check.action = PreflightAction.DROP
+        else:
+            if PreflightAction.FLAG in failed_actions:
+                check.action = PreflightAction.FLAG
+            kept_pages.append(page)
+
+        report.checks.append(check)
+
+    return kept_pages, report
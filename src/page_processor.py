@@ -1,66 +1,161 @@
 import logging
 import os
+import calendar
 import textwrap
-from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from datetime import datetime, timedelta
+from itertools import chain
+from typing import Any, Callable, Iterable, Iterator, TypeVar
 
-from PIL import ImageDraw, Image, ImageOps
+from PIL import Image
 from PIL.Image import Image as ImageType
+from nothion import PersonalStats
 from tickthon import Task
 
-from config import OLD_PAGES_FOLDER
+from config import OLD_PAGES_FOLDER, PRINTED_PAGES_FILE
 from src.image_processor import (add_day_date_to_img, add_week_date_to_img, add_day_tasks_to_img, add_week_tasks_to_img,
-                                 add_stats_to_img, add_journal_qr_to_img, add_journal_summary_to_img, add_date_to_logs_img)
+                                 add_stats_to_img, add_journal_qr_to_img, add_journal_summary_to_img, add_date_to_logs_img,
+                                 add_logs_to_img, paste_overlay_ink, open_template, add_stats_summary_to_img,
+                                 add_weather_to_img)
+from src.data.active_task_model import ActiveTaskModel
+from src.data.hourly_forecast_model import HourlyForecastModel
+from src.data.profile_model import Profile, DEFAULT_PROFILE
 from src.data_processor import DataProcessor
+from src.display_list import DisplayList, DisplayListDraw
+from src.page_archive import PageArchive
+from src.page_layout import get_page_layout
+from src.page_preflight import PreflightAction, PreflightPolicy, preflight_pages, record_printed_pages
+from src.pdf_writer import EncodedPage, PdfCodec, PdfStreamWriter, encode_page, encode_pages, write_pdf
+from src.stats_aggregation import aggregate_stats
+
+T = TypeVar("T")
+
+
+def _decode_tasks(raw_tasks: list[dict]) -> list[ActiveTaskModel]:
+    return [ActiveTaskModel(**raw_task) for raw_task in raw_tasks]
+
+
+def _decode_weather(raw_forecasts: list[dict]) -> list[HourlyForecastModel]:
+    return [HourlyForecastModel(**raw_forecast) for raw_forecast in raw_forecasts]
 
 
 class PageProcessor:
 
-    def __init__(self):
-        self.data_processor = DataProcessor()
+    def __init__(self, profile: Profile = DEFAULT_PROFILE):
+        self.profile = profile
+        self.data_processor = DataProcessor(profile)
+
+    def _get_section_data(self, raw_page: DisplayListDraw, source: str, key: str, fetch: Callable[[], T], default: T,
+                          decode: Callable[[Any], T] = lambda raw_value: raw_value) -> T:
+        """Get the data of a page section within the latency budget of its source, see get_within_budget.
+
+        The source is recorded in the degraded sections of the page when the data is last known or default data.
+        """
+        data, is_degraded = self.data_processor.get_within_budget(source, key, fetch, default, decode)
+        if is_degraded:
+            raw_page.display_list.degraded_sections.append(source)
+
+        return data
+
+    def compose_daily_tasks_page(self, page_date: datetime) -> DisplayList:
+        """Compose the display list of the daily tasks page.
+
+        Args:
+            page_date: Date to add to page.
+
+        Returns:
+            Display list with the draw operations of the page.
+        """
+        raw_tasks_page = DisplayListDraw(get_page_layout("daily_tasks")["template"])
+
+        tasks_page_with_date = add_day_date_to_img(raw_tasks_page, page_date)
+
+        page_day = page_date.strftime("%Y-%m-%d")
+        task_data = self._get_section_data(raw_tasks_page, "tasks", page_day,
+                                           lambda: self.data_processor.get_active_task_data(page_day, 49),
+                                           [], _decode_tasks)
+        add_day_tasks_to_img(tasks_page_with_date, task_data, self.profile.task_columns)
+
+        weather_data = self._get_section_data(raw_tasks_page, "weather", page_day,
+                                              lambda: self.data_processor.get_day_weather(page_date),
+                                              [], _decode_weather)
+        add_weather_to_img(tasks_page_with_date, weather_data)
 
-    def generate_daily_tasks_page(self, page_date: datetime) -> ImageType:
+        return raw_tasks_page.display_list
+
+    def generate_daily_tasks_page(self, page_date: datetime, scale: float = 1) -> ImageType:
         """Generate daily tasks page.
 
         Args:
             page_date: Date to add to page.
+            scale: Scale at which the page is rendered, use values below 1 for quick previews.
 
         Returns:
             Image object with tasks page.
         """
         logging.info(f"Generating daily tasks page for {page_date}")
+        return self.compose_daily_tasks_page(page_date).render(scale)
 
-        tasks_page_base = Image.open("designs/bitacora_diaria_base_front_task.png")
-        raw_tasks_page = ImageDraw.Draw(tasks_page_base)
+    def compose_weekly_tasks_page(self, week_start_date: datetime) -> DisplayList:
+        """Compose the display list of the weekly tasks page.
 
-        tasks_page_with_date = add_day_date_to_img(raw_tasks_page, page_date)
+        Args:
+            week_start_date: Date to add to page.
 
-        task_data = self.data_processor.get_active_task_data(page_date.strftime("%Y-%m-%d"), 49)
-        add_day_tasks_to_img(tasks_page_with_date, task_data)
+        Returns:
+            Display list with the draw operations of the page.
+        """
+        raw_tasks_page = DisplayListDraw(get_page_layout("weekly_tasks")["template"])
 
-        return tasks_page_base
+        tasks_page_with_date = add_week_date_to_img(raw_tasks_page, week_start_date)
+
+        task_data = self._get_section_data(raw_tasks_page, "tasks", f"week-{week_start_date.strftime('%Y-%m-%d')}",
+                                           lambda: self.data_processor.get_active_task_data(
+                                               date="", max_title_length=45, discard_tasks_with_parents=True),
+                                           [], _decode_tasks)
+        add_week_tasks_to_img(tasks_page_with_date, task_data, self.profile.task_columns)
 
-    def generate_weekly_tasks_page(self, week_start_date: datetime) -> ImageType:
+        return raw_tasks_page.display_list
+
+    def generate_weekly_tasks_page(self, week_start_date: datetime, scale: float = 1) -> ImageType:
         """Generate tasks page.
 
         Args:
             week_start_date: Date to add to page.
+            scale: Scale at which the page is rendered, use values below 1 for quick previews.
 
         Returns:
             Image object with tasks page.
         """
         logging.info(f"Generating weekly tasks page for {week_start_date}")
+        return self.compose_weekly_tasks_page(week_start_date).render(scale)
 
-        tasks_page_base = Image.open("designs/bitacora_semanal_base_front_task.png")
-        raw_tasks_page = ImageDraw.Draw(tasks_page_base)
+    def compose_stats_page(self, page_date: datetime) -> DisplayList:
+        """Compose the display list of the stats page.
 
-        tasks_page_with_date = add_week_date_to_img(raw_tasks_page, week_start_date)
+        Args:
+            page_date: The date for which the stats page is to be composed.
+
+        Returns:
+            Display list with the draw operations of the page.
+        """
+        raw_stats_page = DisplayListDraw(get_page_layout("stats")["template"])
 
-        task_data = self.data_processor.get_active_task_data(date="", max_title_length=45, discard_tasks_with_parents=True)
-        add_week_tasks_to_img(tasks_page_with_date, task_data)
+        page_day = page_date.strftime("%Y-%m-%d")
+        day_stats = self._get_section_data(raw_stats_page, "stats", page_day,
+                                           lambda: self.data_processor.get_day_stats(page_date),
+                                           PersonalStats(date=page_day, work_time=0, leisure_time=0, focus_time=0),
+                                           lambda raw_stats: PersonalStats(**raw_stats))
+        add_stats_to_img(raw_stats_page, day_stats)
 
-        return tasks_page_base
+        day_journal_url = self._get_section_data(raw_stats_page, "journal_url", page_day,
+                                                 lambda: self.data_processor.get_day_journal_url(page_date), None)
+        if day_journal_url is not None:
+            add_journal_qr_to_img(raw_stats_page, day_journal_url)
 
-    def generate_stats_page(self, page_date: datetime) -> ImageType:
+        return raw_stats_page.display_list
+
+    def generate_stats_page(self, page_date: datetime, scale: float = 1) -> ImageType:
         """Generate a stats page as an image for a given date.
 
         This function takes a date as an argument and generates the stats for the day, and a QR code for the journal of
@@ -68,69 +163,214 @@ class PageProcessor:
 
         Args:
             page_date: The date for which the logs page is to be generated.
+            scale: Scale at which the page is rendered, use values below 1 for quick previews.
 
         Returns:
             A PIL Image object representing the generated stats page.
         """
         logging.info(f"Generating stats page for {page_date}")
+        return self.compose_stats_page(page_date).render(scale)
+
+    def generate_stats_pages(self, pages_dates: list[datetime], scale: float = 1) -> list[ImageType]:
+        """Generate the stats pages of several dates, fetching all their stats and journal entries with one query each.
 
-        stats_page_base = Image.open("designs/bitacora_diaria_base_front_stats.png")
-        raw_logs_page = ImageDraw.Draw(stats_page_base)
+        Only the dates without a journal entry in Notion make their own journal query.
 
-        day_stats = self.data_processor.get_day_stats(page_date)
-        add_stats_to_img(raw_logs_page, day_stats)
+        Args:
+            pages_dates: Dates for which the stats pages are to be generated.
+            scale: Scale at which the page is rendered, use values below 1 for quick previews.
 
-        day_journal_url = self.data_processor.get_day_journal_url(page_date)
-        add_journal_qr_to_img(stats_page_base, day_journal_url)
+        Returns:
+            List of stats pages in the same order as the dates.
+        """
+        self.data_processor.prefetch_stats(pages_dates)
+        self.data_processor.prefetch_journal_data(pages_dates)
+        return [self.generate_stats_page(page_date, scale) for page_date in pages_dates]
 
-        return stats_page_base
+    def compose_stats_summary_page(self, start_date: datetime, end_date: datetime, title: str) -> DisplayList:
+        """Compose the display list of a stats summary page for a date range.
 
-    def generate_journal_page(self) -> ImageType:
+        The stats of the whole range are fetched with a single query and aggregated in one vectorized pass.
+
+        Args:
+            start_date: First date of the range.
+            end_date: Last date of the range, inclusive.
+            title: Title of the page.
+
+        Returns:
+            Display list with the draw operations of the page.
+        """
+        summary_layout = get_page_layout("stats_summary")
+        raw_summary_page = DisplayListDraw(summary_layout["template"])
+
+        range_stats = self._get_section_data(raw_summary_page, "stats",
+                                             f"{start_date.strftime('%Y-%m-%d')}-{end_date.strftime('%Y-%m-%d')}",
+                                             lambda: self.data_processor.get_stats_between_dates(start_date, end_date),
+                                             [], lambda raw_stats: [PersonalStats(**day_stats)
+                                                                    for day_stats in raw_stats])
+        summary = aggregate_stats(range_stats, start_date, end_date, summary_layout["sparkline"]["rolling_days"])
+        add_stats_summary_to_img(raw_summary_page, summary, title)
+
+        return raw_summary_page.display_list
+
+    def generate_monthly_stats_page(self, month_date: datetime, scale: float = 1) -> ImageType:
+        """Generate a summary page with the stats of a month.
+
+        Args:
+            month_date: Any date of the month to summarize.
+            scale: Scale at which the page is rendered, use values below 1 for quick previews.
+
+        Returns:
+            Image object with the monthly stats page.
+        """
+        logging.info(f"Generating monthly stats page for {month_date}")
+        start_date = month_date.replace(day=1)
+        end_date = start_date + timedelta(days=calendar.monthrange(start_date.year, start_date.month)[1] - 1)
+
+        return self.compose_stats_summary_page(start_date, end_date, start_date.strftime("%B %Y")).render(scale)
+
+    def generate_yearly_stats_page(self, year_date: datetime, scale: float = 1) -> ImageType:
+        """Generate a year in review page with the stats of a year.
+
+        Args:
+            year_date: Any date of the year to summarize.
+            scale: Scale at which the page is rendered, use values below 1 for quick previews.
+
+        Returns:
+            Image object with the yearly stats page.
+        """
+        logging.info(f"Generating yearly stats page for {year_date.year}")
+        start_date = year_date.replace(month=1, day=1)
+        end_date = year_date.replace(month=12, day=31)
+
+        return self.compose_stats_summary_page(start_date, end_date, f"{year_date.year} in review").render(scale)
+
+    def generate_journal_page(self, scale: float = 1) -> ImageType:
         """Generate a page with the daily journal.
 
+        Args:
+            scale: Scale at which the page is rendered, use values below 1 for quick previews.
+
         Returns:
             Image object with thoughts page.
         """
-        journal_page_base = Image.open("designs/bitacora_diaria_base_journal.png")
+        journal_page_base = open_template(get_page_layout("journal")["template"], scale)
         return journal_page_base
 
     @staticmethod
-    def generate_logs_page(page_date: datetime) -> ImageType:
+    def compose_logs_page(page_date: datetime, logs: Iterator[str] | None = None,
+                          layout_name: str = "logs") -> DisplayList:
+        """Compose the display list of the logs page.
+
+        Args:
+            page_date: The date for which the logs page is to be composed.
+            logs: Logs to add to the page, only the logs that fit in it are consumed.
+            layout_name: Layout of the page, logs for the page to log the day by hand and logs_continuation for the
+                pages with the logged activities.
+
+        Returns:
+            Display list with the draw operations of the page.
+        """
+        raw_logs_page = DisplayListDraw(get_page_layout(layout_name)["template"])
+
+        add_date_to_logs_img(raw_logs_page, page_date, layout_name)
+        if logs is not None:
+            add_logs_to_img(raw_logs_page, logs, layout_name)
+
+        return raw_logs_page.display_list
+
+    @staticmethod
+    def generate_logs_page(page_date: datetime, scale: float = 1, logs: Iterator[str] | None = None) -> ImageType:
         """Generate a page to log activities through the day.
 
         Args:
             page_date: The date for which the logs page is to be generated.
+            scale: Scale at which the page is rendered, use values below 1 for quick previews.
+            logs: Logs to add below the hand logging area, only the max_rows of the logs layout are consumed.
 
         Returns:
             A PIL Image object representing the generated logs page.
         """
-        logs_page_base = Image.open("designs/bitacora_diaria_base_front_logs.png")
-        raw_logs_page = ImageDraw.Draw(logs_page_base)
+        return PageProcessor.compose_logs_page(page_date, logs).render(scale)
+
+    def generate_logs_pages(self, page_date: datetime, scale: float = 1) -> Iterator[ImageType]:
+        """Generate the logs pages of a day, the logs page followed by as many continuation pages as the logs need.
+
+        The first logs of the day are laid out on the logs page, up to the max_rows of its layout, and the rest on the
+        continuation pages. Pages are generated lazily as they are consumed, so a day with many logs is never held in
+        memory at once.
+
+        Args:
+            page_date: The date of the logs.
+            scale: Scale at which the pages are rendered, use values below 1 for quick previews.
+
+        Returns:
+            Iterator with the logs pages in order.
+        """
+        logs = self.data_processor.get_day_logs(page_date.strftime("%Y-%m-%d"))
+        yield self.generate_logs_page(page_date, scale, logs)
+
+        while (next_log := next(logs, None)) is not None:
+            yield self.compose_logs_page(page_date, chain([next_log], logs), "logs_continuation").render(scale)
+
+    @staticmethod
+    def compose_recap_page(raw_summary_recap: str) -> DisplayList:
+        """Compose the display list of the recap page.
+
+        Args:
+            raw_summary_recap: The daily recap to add to the page.
+
+        Returns:
+            Display list with the draw operations of the page.
+        """
+        recap_layout = get_page_layout("recap")
+        raw_recap_page = DisplayListDraw(recap_layout["template"])
 
-        add_date_to_logs_img(raw_logs_page, page_date)
+        summary_recap = "\n".join([textwrap.fill(paragraph, width=recap_layout["summary"]["line_width"])
+                                   for paragraph in raw_summary_recap.split("\n")])
 
-        return logs_page_base
+        add_journal_summary_to_img(raw_recap_page, summary_recap)
+        return raw_recap_page.display_list
 
     @staticmethod
-    def generate_recap_page(raw_summary_recap: str) -> ImageType:
+    def generate_recap_page(raw_summary_recap: str, scale: float = 1) -> ImageType:
         """Generate a page with the daily recap.
 
         Args:
             raw_summary_recap: The daily recap to add to the page.
+            scale: Scale at which the page is rendered, use values below 1 for quick previews.
 
         Returns:
             A PIL Image object representing the generated recap page.
         """
-        recap_page_base = Image.open("designs/bitacora_diaria_empty.png")
-        raw_recap_page = ImageDraw.Draw(recap_page_base)
+        return PageProcessor.compose_recap_page(raw_summary_recap).render(scale)
 
-        summary_recap = "\n".join([textwrap.fill(paragraph, width=68) for paragraph in raw_summary_recap.split("\n")])
+    @staticmethod
+    def _open_old_page(page_archive: PageArchive, old_date: datetime, page_kind: str, scale: float = 1) -> ImageType:
+        """Open an old page from the page archive, falling back to the loose PNGs that haven't been migrated.
 
-        add_journal_summary_to_img(raw_recap_page, summary_recap)
-        return recap_page_base
+        Args:
+            page_archive: Archive with the old pages.
+            old_date: Date of the old page.
+            page_kind: Kind of the page, one of PageArchive.PAGE_KINDS.
+            scale: Scale at which the page is rendered.
+
+        Returns:
+            Image object with the old page.
+        """
+        if page_archive.has_page(old_date, page_kind):
+            old_page = page_archive.load_page(old_date, page_kind)
+        else:
+            old_page_file = f"{old_date.strftime('%d-%b-%Y').lower()}-old-{page_kind}-page.png"
+            old_page = Image.open(f"{OLD_PAGES_FOLDER}/{old_page_file}")
+
+        if scale != 1:
+            old_page = old_page.resize((round(old_page.width * scale), round(old_page.height * scale)))
+
+        return old_page
 
     @staticmethod
-    def generate_old_bitacora_pages(stats_page: ImageType, old_date: datetime) -> list[ImageType]:
+    def generate_old_bitacora_pages(stats_page: ImageType, old_date: datetime, scale: float = 1) -> list[ImageType]:
         """Generate a front page as an image for a given date.
 
         This function takes a date as an argument and generates a front page as an image. The front page includes the
@@ -140,19 +380,20 @@ class PageProcessor:
         Args:
             stats_page: The logs page to merge with the tasks page.
             old_date: The date for which the logs page is to be generated.
+            scale: Scale at which the page is rendered, use values below 1 for quick previews.
 
         Returns:
             A PIL Image object representing the generated front page.
         """
         logging.info(f"Generating front page for {old_date}")
 
+        page_archive = PageArchive()
         try:
-            old_task_page = Image.open(f"{OLD_PAGES_FOLDER}/{old_date.strftime('%d-%b-%Y').lower()}-old-task-page.png")
-            old_task_page.paste(stats_page, (0, 0), mask=ImageOps.invert(stats_page.copy().convert('L')))
+            old_task_page = PageProcessor._open_old_page(page_archive, old_date, "task", scale).convert(stats_page.mode)
+            paste_overlay_ink(old_task_page, stats_page)
 
-            old_journal_page = Image.open(f"{OLD_PAGES_FOLDER}/{old_date.strftime('%d-%b-%Y').lower()}"
-                                          f"-old-journal-page.png")
-            old_recap_page = Image.open(f"{OLD_PAGES_FOLDER}/{old_date.strftime('%d-%b-%Y').lower()}-old-recap-page.png")
+            old_journal_page = PageProcessor._open_old_page(page_archive, old_date, "journal", scale)
+            old_recap_page = PageProcessor._open_old_page(page_archive, old_date, "recap", scale)
 
             return [old_task_page, old_journal_page, old_recap_page]
         except FileNotFoundError:
@@ -161,24 +402,140 @@ class PageProcessor:
         return []
 
     @staticmethod
-    def save_pages_as_pdf(page_title: str, pages: list[ImageType], open_after_save: bool = False):
+    def _generate_encoded_old_bitacora_pages(stats_display_list: DisplayList, old_date: datetime,
+                                             scale: float = 1) -> list[EncodedPage]:
+        """Render the stats page of a date and merge it with the old pages, returning the pages encoded.
+
+        It runs in the worker processes, so only the display list goes to the worker and only the compressed page
+        streams come back.
+        """
+        stats_page = stats_display_list.render(scale)
+        return [encode_page(page) for page in PageProcessor.generate_old_bitacora_pages(stats_page, old_date, scale)]
+
+    def generate_old_bitacora_pages_batch(self, old_dates: list[datetime], max_workers: int | None = None,
+                                          scale: float = 1) -> list[EncodedPage]:
+        """Generate the old bitacora pages of several dates, rendering and merging the pages across worker processes.
+
+        The stats pages are composed in this process, where the data of every date is fetched with one query per
+        source, and their display lists are rendered, merged and encoded in the workers.
+
+        Args:
+            old_dates: Dates for which the old pages are to be generated.
+            max_workers: Maximum number of worker processes, defaults to the number of processors.
+            scale: Scale at which the pages are rendered, use values below 1 for quick previews.
+
+        Returns:
+            List with the encoded old pages of every date in order, ready for write_pdf. Dates without old pages are
+            skipped.
+        """
+        logging.info(f"Generating old bitacora pages for {len(old_dates)} dates")
+        self.data_processor.prefetch_stats(old_dates)
+        self.data_processor.prefetch_journal_data(old_dates)
+        stats_display_lists = [self.compose_stats_page(old_date) for old_date in old_dates]
+
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            dates_pages = executor.map(PageProcessor._generate_encoded_old_bitacora_pages, stats_display_lists,
+                                       old_dates, [scale] * len(old_dates))
+            return [page for date_pages in dates_pages for page in date_pages]
+
+    @staticmethod
+    def save_pages_as_pdf(page_title: str, pages: list[ImageType], open_after_save: bool = False,
+                          codecs: PdfCodec | list[PdfCodec] = PdfCodec.AUTO, quality: int = 75,
+                          preflight_policy: PreflightPolicy | None = None,
+                          printed_pages_file: str = PRINTED_PAGES_FILE):
         """Saves the given page as a PDF file and optionally opens it after saving.
 
+        If a preflight policy is given the pages go through the preflight first, which flags or drops the blank and
+        duplicated pages and logs a report. The page images are compressed in a thread pool and the PDF is assembled from the encoded streams in
+        order.
+
         Args:
             page_title: The title of the page, which will be used as the filename for the saved PDF.
             pages: The ImageDraw object representing the page to be saved.
             open_after_save: A flag indicating whether to open the saved PDF file. Defaults to False.
+            codecs: Codec used to compress every page, or one codec per page. Defaults to AUTO, CCITT for bilevel
+                pages and DCT for the rest.
+            quality: JPEG quality used by the DCT codec.
+            preflight_policy: Actions for the pages that fail the preflight. Defaults to None, which skips the
+                preflight.
+            printed_pages_file: File with the hashes of the printed pages, used to detect reprints.
         """
         logging.info(f"Saving {page_title}")
         filename = f"{page_title}.pdf"
 
-        other_pages = pages[1:] if len(pages) > 1 else []
+        preflight_report = None
+        if preflight_policy is not None and len(pages) > 0:
+            pages, preflight_report = preflight_pages(pages, preflight_policy, printed_pages_file)
+            logging.info(f"Preflight of {page_title}\n{preflight_report.format()}")
+            if len(pages) == 0:
+                logging.warning(f"The preflight dropped every page of {page_title}, {filename} was not saved")
+            if not isinstance(codecs, PdfCodec):
+                codecs = [codec for codec, check in zip(codecs, preflight_report.checks)
+                          if check.action != PreflightAction.DROP]
+
         if len(pages) > 0:
-            pages[0].save(filename, "PDF", resolution=700, save_all=True, append_images=other_pages)
+            write_pdf(filename, encode_pages(pages, codecs, quality), resolution=700)
+            if preflight_report is not None:
+                record_printed_pages(preflight_report, page_title, printed_pages_file)
 
             if open_after_save:
                 os.startfile(filename)
 
+    @staticmethod
+    def save_page_stream_as_pdf(page_title: str, pages: Iterable[ImageType], open_after_save: bool = False,
+                                codec: PdfCodec = PdfCodec.AUTO, quality: int = 75):
+        """Saves pages as a PDF file as they are generated, so they don't have to be in memory at the same time.
+
+        Every page is encoded in a background thread while the next one is generated, then written to the file right
+        away. The pages skip the preflight, which needs the whole batch to find the duplicated pages.
+
+        Args:
+            page_title: The title of the pages, which will be used as the filename for the saved PDF.
+            pages: Pages to save in order, consumed one at a time.
+            open_after_save: A flag indicating whether to open the saved PDF file. Defaults to False.
+            codec: Codec used to compress every page. Defaults to AUTO, CCITT for bilevel pages and DCT for the rest.
+            quality: JPEG quality used by the DCT codec.
+        """
+        logging.info(f"Saving {page_title}")
+        filename = f"{page_title}.pdf"
+
+        with open(filename, "wb") as pdf_file, ThreadPoolExecutor(max_workers=1) as executor:
+            pdf_writer = PdfStreamWriter(pdf_file, resolution=700)
+            encoded_page_future = None
+            for page in pages:
+                if encoded_page_future is not None:
+                    pdf_writer.add_page(encoded_page_future.result())
+                encoded_page_future = executor.submit(encode_page, page, codec, quality)
+
+            if encoded_page_future is not None:
+                pdf_writer.add_page(encoded_page_future.result())
+            pdf_writer.close()
+
+        if open_after_save:
+            os.startfile(filename)
+
+    @staticmethod
+    def save_page_preview(page_title: str, page: ImageType, preview_format: str = "PNG") -> str:
+        """Saves a reduced scale page for a quick look on screen.
+
+        Args:
+            page_title: The title of the page, which will be used as the filename for the saved preview.
+            page: The page to be saved, usually rendered with a scale below 1.
+            preview_format: Image format of the preview, "PNG" or "WEBP".
+
+        Returns:
+            The filename of the saved preview.
+        """
+        logging.info(f"Saving preview {page_title}")
+        filename = f"{page_title}.{preview_format.lower()}"
+
+        if preview_format.upper() == "WEBP":
+            page.save(filename, "WEBP", quality=80, method=0)
+        else:
+            page.save(filename, "PNG", compress_level=1)
+
+        return filename
+
     @staticmethod
     def save_pages_as_png(page_title: str, page: ImageType):
         """Saves the given page as a PDF file and optionally opens it after saving.
@@ -210,10 +567,13 @@ class PageProcessor:
             self.data_processor.notion_client.add_highlight_log(highlight_task)
 
     @staticmethod
-    def generate_empty_page() -> ImageType:
+    def generate_empty_page(scale: float = 1) -> ImageType:
         """Generate an empty page.
 
+        Args:
+            scale: Scale at which the page is rendered, use values below 1 for quick previews.
+
         Returns:
             Image object with empty page.
         """
-        return Image.open("designs/bitacora_diaria_empty.png")
+        return open_template(get_page_layout("empty")["template"], scale)
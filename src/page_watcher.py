@@ -0,0 +1,146 @@
+import logging
+import time
+from datetime import datetime
+from typing import Callable
+
+from attr import define, field
+from PIL.Image import Image as ImageType
+
+from config import WATCH_POLL_SECONDS, WATCH_NOTION_POLL_SECONDS, WATCH_DEBOUNCE_SECONDS
+from src.display_list import DisplayList
+from src.page_layout import get_page_layout
+from src.page_processor import PageProcessor
+
+ticktick_changes_url = "/api/v2/batch/check/{checkpoint}"
+
+
+@define
+class WatchedPage:
+    """Page kept up to date by the watcher.
+
+    Attributes:
+        layout_name: Layout of the page, its watch_sections are the regions rendered again when they change.
+        source: Source of the page data, "ticktick" or "notion".
+        compose: Function that composes the page with the current data.
+        display_list: Display list of the current page.
+        page: Current page, rendered at full scale.
+    """
+    layout_name: str
+    source: str
+    compose: Callable[[], DisplayList]
+    display_list: DisplayList | None = None
+    page: ImageType | None = field(default=None, eq=False)
+
+
+class PageWatcher:
+    """Keeps the pages of a date up to date with TickTick and Notion, rewriting their PDF when they change.
+
+    TickTick is polled with its incremental sync endpoint, which only returns the changes after the last checkpoint,
+    and the pages are composed again only after the changes stop for the debounce time. Notion doesn't have a cheap
+    change check, so its pages are composed again on a longer interval. Only the page sections whose draw operations
+    changed are rendered again, on top of the current page.
+    """
+
+    def __init__(self, page_processor: PageProcessor, page_date: datetime, pdf_title: str,
+                 week_start_date: datetime | None = None, poll_seconds: float = WATCH_POLL_SECONDS,
+                 notion_poll_seconds: float = WATCH_NOTION_POLL_SECONDS,
+                 debounce_seconds: float = WATCH_DEBOUNCE_SECONDS):
+        self.page_processor = page_processor
+        self.pdf_title = pdf_title
+        self.poll_seconds = poll_seconds
+        self.notion_poll_seconds = notion_poll_seconds
+        self.debounce_seconds = debounce_seconds
+        self._ticktick_checkpoint = 0
+
+        self.watched_pages = [WatchedPage("daily_tasks", "ticktick",
+                                          lambda: page_processor.compose_daily_tasks_page(page_date)),
+                              WatchedPage("stats", "notion", lambda: page_processor.compose_stats_page(page_date))]
+        if week_start_date is not None:
+            self.watched_pages.append(WatchedPage("weekly_tasks", "ticktick",
+                                                  lambda: page_processor.compose_weekly_tasks_page(week_start_date)))
+
+    def _has_ticktick_changed(self) -> bool:
+        """Check for TickTick changes after the last checkpoint, without downloading the tasks.
+
+        Returns:
+            True if there are changes, or if the changes can't be checked.
+        """
+        try:
+            raw_changes = self.page_processor.data_processor.ticktick_client.ticktick_api.get(
+                ticktick_changes_url.format(checkpoint=self._ticktick_checkpoint)).json()
+        except Exception:
+            logging.exception("Could not check the TickTick changes")
+            return True
+
+        previous_checkpoint = self._ticktick_checkpoint
+        self._ticktick_checkpoint = raw_changes.get("checkPoint", previous_checkpoint)
+        task_changes = raw_changes.get("syncTaskBean") or {}
+
+        return (self._ticktick_checkpoint != previous_checkpoint
+                or bool(task_changes.get("update")) or bool(task_changes.get("delete")))
+
+    def _refresh_pages(self, source: str) -> bool:
+        """Compose again the pages of a source and render the sections that changed.
+
+        Args:
+            source: Source whose pages are refreshed, "ticktick" or "notion".
+
+        Returns:
+            True if any page changed.
+        """
+        self.page_processor.data_processor.start_run()
+
+        has_changed = False
+        for watched_page in self.watched_pages:
+            if watched_page.source != source:
+                continue
+
+            display_list = watched_page.compose()
+            if watched_page.page is None:
+                watched_page.page = display_list.render()
+                has_changed = True
+            else:
+                sections = get_page_layout(watched_page.layout_name)["watch_sections"]
+                changed_sections = display_list.get_changed_sections(watched_page.display_list, sections)
+                for section_name in changed_sections:
+                    logging.info(f"Rendering the {section_name} section of the {watched_page.layout_name} page")
+                    display_list.render_region(watched_page.page, sections[section_name])
+                has_changed = has_changed or bool(changed_sections)
+
+            watched_page.display_list = display_list
+
+        return has_changed
+
+    def _save_pages(self):
+        pages = [watched_page.page for watched_page in self.watched_pages]
+        self.page_processor.save_pages_as_pdf(self.pdf_title, pages)
+
+    def watch(self):
+        """Render the pages, save them and keep them up to date until the process is interrupted."""
+        self._has_ticktick_changed()
+        self._refresh_pages("ticktick")
+        self._refresh_pages("notion")
+        self._save_pages()
+
+        last_notion_poll = time.monotonic()
+        ticktick_changed_at: float | None = None
+        try:
+            while True:
+                time.sleep(self.poll_seconds)
+
+                if self._has_ticktick_changed():
+                    logging.info("TickTick changed, waiting for the changes to settle")
+                    ticktick_changed_at = time.monotonic()
+
+                refreshed_sources = []
+                if ticktick_changed_at is not None and time.monotonic() - ticktick_changed_at >= self.debounce_seconds:
+                    ticktick_changed_at = None
+                    refreshed_sources.append("ticktick")
+                if time.monotonic() - last_notion_poll >= self.notion_poll_seconds:
+                    last_notion_poll = time.monotonic()
+                    refreshed_sources.append("notion")
+
+                if any([self._refresh_pages(source) for source in refreshed_sources]):
+                    self._save_pages()
+        except KeyboardInterrupt:
+            logging.info("Stopped watching the pages")
@@ -0,0 +1,223 @@
+import io
+import zlib
+from typing import BinaryIO, Iterable
+from concurrent.futures import ThreadPoolExecutor
+from enum import Enum
+
+from attr import define
+from PIL import Image
+from PIL.Image import Image as ImageType
+
+
+class PdfCodec(Enum):
+    """Valid compression codecs for the page images."""
+    AUTO = "auto"
+    FLATE = "FlateDecode"
+    DCT = "DCTDecode"
+    CCITT = "CCITTFaxDecode"
+
+
+@define
+class EncodedPage:
+    """Page image stream already compressed and ready to be written in a PDF."""
+    width: int
+    height: int
+    color_space: str
+    bits_per_component: int
+    codec: PdfCodec
+    stream: bytes
+
+
+def choose_page_codec(page: ImageType) -> PdfCodec:
+    """Choose the codec for a page, bilevel pages use CCITT and the rest DCT like the Pillow PDF writer.
+
+    Args:
+        page: Page to choose the codec for.
+
+    Returns:
+        Codec for the page.
+    """
+    return PdfCodec.CCITT if page.mode == "1" else PdfCodec.DCT
+
+
+def _extract_ccitt_stream(page: ImageType) -> bytes:
+    """Compress a bilevel page with CCITT group 4 and extract the raw stream from the TIFF container.
+
+    Args:
+        page: Page in mode "1".
+
+    Returns:
+        CCITT group 4 stream of the page.
+    """
+    tiff_buffer = io.BytesIO()
+    page.save(tiff_buffer, "TIFF", compression="group4", strip_size=((page.width + 7) // 8) * page.height)
+
+    with Image.open(tiff_buffer) as tiff_page:
+        strip_offset = tiff_page.tag_v2[273][0]
+        strip_length = tiff_page.tag_v2[279][0]
+
+    return tiff_buffer.getvalue()[strip_offset:strip_offset + strip_length]
+
+
+def encode_page(page: ImageType, codec: PdfCodec = PdfCodec.AUTO, quality: int = 75) -> EncodedPage:
+    """Compress the image stream of a page.
+
+    Args:
+        page: Page to encode.
+        codec: Codec used to compress the page, AUTO chooses it from the page mode.
+        quality: JPEG quality used by the DCT codec.
+
+    Returns:
+        Encoded page.
+    """
+    if codec == PdfCodec.AUTO:
+        codec = choose_page_codec(page)
+
+    match codec:
+        case PdfCodec.CCITT:
+            page = page.convert("1")
+            stream = _extract_ccitt_stream(page)
+        case PdfCodec.DCT:
+            page = page.convert("L" if page.mode in ("1", "L") else "RGB")
+            jpeg_buffer = io.BytesIO()
+            page.save(jpeg_buffer, "JPEG", quality=quality)
+            stream = jpeg_buffer.getvalue()
+        case _:
+            if page.mode not in ("1", "L", "RGB"):
+                page = page.convert("RGB")
+            stream = zlib.compress(page.tobytes())
+
+    return EncodedPage(width=page.width,
+                       height=page.height,
+                       color_space="DeviceRGB" if page.mode == "RGB" else "DeviceGray",
+                       bits_per_component=1 if page.mode == "1" else 8,
+                       codec=codec,
+                       stream=stream)
+
+
+def encode_pages(pages: list[ImageType], codecs: PdfCodec | list[PdfCodec] = PdfCodec.AUTO, quality: int = 75,
+                 max_workers: int | None = None) -> list[EncodedPage]:
+    """Compress the image streams of several pages in a thread pool, the codecs release the GIL while compressing.
+
+    Args:
+        pages: Pages to encode.
+        codecs: Codec for every page, or one codec per page.
+        quality: JPEG quality used by the DCT codec.
+        max_workers: Maximum number of encoding threads, defaults to the ThreadPoolExecutor default.
+
+    Returns:
+        Encoded pages in the same order as the pages.
+    """
+    if isinstance(codecs, PdfCodec):
+        codecs = [codecs] * len(pages)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(encode_page, pages, codecs, [quality] * len(pages)))
+
+
+def _image_dictionary(encoded_page: EncodedPage) -> bytes:
+    decode_parms = ""
+    if encoded_page.codec == PdfCodec.CCITT:
+        decode_parms = (f" /DecodeParms << /K -1 /BlackIs1 true /Columns {encoded_page.width}"
+                        f" /Rows {encoded_page.height} >>")
+
+    return (f"<< /Type /XObject /Subtype /Image /Width {encoded_page.width} /Height {encoded_page.height}"
+            f" /ColorSpace /{encoded_page.color_space} /BitsPerComponent {encoded_page.bits_per_component}"
+            f" /Filter /{encoded_page.codec.value}{decode_parms} /Length {len(encoded_page.stream)} >>").encode()
+
+
+class PdfStreamWriter:
+    """Writes a PDF with one full page image per encoded page, page by page.
+
+    Every page is written as soon as it's added, only the object offsets are kept until the page tree, the catalog
+    and the cross reference table are written on close, so the pages don't have to be in memory at the same time.
+    The stream must support tell.
+    """
+    CATALOG_ID = 1
+    PAGES_ID = 2
+
+    def __init__(self, pdf_file: BinaryIO, resolution: float = 700):
+        self.pdf_file = pdf_file
+        self.resolution = resolution
+        self._pdf_start = pdf_file.tell()
+        self._object_offsets: dict[int, int] = {}
+        self._page_ids: list[int] = []
+
+        pdf_file.write(b"%PDF-1.4\n%\xe2\xe3\xcf\xd3\n")
+
+    def _write_object(self, object_id: int, content: bytes):
+        self._object_offsets[object_id] = self.pdf_file.tell() - self._pdf_start
+        self.pdf_file.write(f"{object_id} 0 obj\n".encode() + content + b"\nendobj\n")
+
+    def add_page(self, encoded_page: EncodedPage):
+        page_id = 3 + len(self._page_ids) * 3
+        image_id, content_id = page_id + 1, page_id + 2
+        page_width = encoded_page.width * 72 / self.resolution
+        page_height = encoded_page.height * 72 / self.resolution
+        content = f"q {page_width:.4f} 0 0 {page_height:.4f} 0 0 cm /image Do Q".encode()
+
+        self._write_object(page_id, (f"<< /Type /Page /Parent {self.PAGES_ID} 0 R"
+                                     f" /MediaBox [0 0 {page_width:.4f} {page_height:.4f}]"
+                                     f" /Resources << /XObject << /image {image_id} 0 R >> >>"
+                                     f" /Contents {content_id} 0 R >>").encode())
+        self._write_object(image_id,
+                           _image_dictionary(encoded_page) + b"\nstream\n" + encoded_page.stream + b"\nendstream")
+        self._write_object(content_id,
+                           f"<< /Length {len(content)} >>\nstream\n".encode() + content + b"\nendstream")
+        self._page_ids.append(page_id)
+
+    def close(self):
+        """Write the page tree, the catalog and the cross reference table, ending the PDF."""
+        self._write_object(self.PAGES_ID, (f"<< /Type /Pages /Count {len(self._page_ids)} /Kids ["
+                                           + " ".join(f"{page_id} 0 R" for page_id in self._page_ids)
+                                           + "] >>").encode())
+        self._write_object(self.CATALOG_ID, f"<< /Type /Catalog /Pages {self.PAGES_ID} 0 R >>".encode())
+
+        objects_count = len(self._object_offsets)
+        xref_offset = self.pdf_file.tell() - self._pdf_start
+        self.pdf_file.write(f"xref\n0 {objects_count + 1}\n0000000000 65535 f \n".encode())
+        for object_id in range(1, objects_count + 1):
+            self.pdf_file.write(f"{self._object_offsets[object_id]:010d} 00000 n \n".encode())
+        self.pdf_file.write(f"trailer\n<< /Size {objects_count + 1} /Root {self.CATALOG_ID} 0 R >>\nstartxref\n"
+                            f"{xref_offset}\n%%EOF\n".encode())
+
+
+def write_pdf_to_stream(pdf_file: BinaryIO, encoded_pages: Iterable[EncodedPage], resolution: float = 700):
+    """Assemble a PDF with one full page image per encoded page, in order.
+
+    Args:
+        pdf_file: Binary stream where the PDF is written, it must support tell.
+        encoded_pages: Pre-encoded page images, consumed one at a time.
+        resolution: Resolution of the page images in dots per inch.
+    """
+    pdf_writer = PdfStreamWriter(pdf_file, resolution)
+    for encoded_page in encoded_pages:
+        pdf_writer.add_page(encoded_page)
+    pdf_writer.close()
+
+
+def write_pdf(filename: str, encoded_pages: Iterable[EncodedPage], resolution: float = 700):
+    """Assemble a PDF file with one full page image per encoded page, in order.
+
+    Args:
+        filename: Path of the PDF file.
+        encoded_pages: Pre-encoded page images, consumed one at a time.
+        resolution: Resolution of the page images in dots per inch.
+    """
+    with open(filename, "wb") as pdf_file:
+        write_pdf_to_stream(pdf_file, encoded_pages, resolution)
+
+
+def get_pdf_bytes(encoded_pages: list[EncodedPage], resolution: float = 700) -> bytes:
+    """Assemble a PDF in memory, see write_pdf_to_stream.
+
+    Args:
+        encoded_pages: Pre-encoded page images.
+        resolution: Resolution of the page images in dots per inch.
+
+    Returns:
+        Content of the PDF file.
+    """
+    pdf_buffer = io.BytesIO()
+    write_pdf_to_stream(pdf_buffer, encoded_pages, resolution)
+    return pdf_buffer.getvalue()
@@ -0,0 +1,220 @@
+import json
+import threading
+import time
+from datetime import datetime
+from typing import List
+
+import requests
+from nothion import NotionClient, PersonalStats
+from nothion._notion_api import NotionAPI
+from nothion._notion_payloads import NotionPayloads
+from tickthon import Task, TicktickClient
+from tickthon._ticktick_api import TicktickAPI
+
+from src.call_memoizer import CallMemoizer
+from src.data.profile_model import NotionDatabaseIds
+from src.http_transport import HttpTransport, RETRY_STATUS_CODES
+
+
+class PooledTicktickAPI(TicktickAPI):
+    """TicktickAPI that sends every request, including the login, through the shared transport.
+
+    The login runs on the first request that needs the token instead of in the constructor, so it runs within the
+    latency budget of that request and a slow or down TickTick doesn't block the creation of the clients.
+    """
+
+    def __init__(self, username: str, password: str, transport: HttpTransport):
+        self.session = transport.create_session()
+        self.session.headers.update({"Content-Type": "application/json",
+                                     "User-Agent": self.USER_AGENT,
+                                     "x-device": self.X_DEVICE_
+                                     })
+        self._username = username
+        self._password = password
+        self._auth_token: str | None = None
+        self._login_lock = threading.Lock()
+
+    @property
+    def auth_token(self) -> str:
+        with self._login_lock:
+            if self._auth_token is None:
+                self._auth_token = self.login(self._username, self._password)
+            return self._auth_token
+
+    def login(self, user: str, password: str) -> str:
+        payload = json.dumps({
+            "username": user,
+            "password": password
+        })
+
+        response = self.session.post(self.SIGNIN_URL, headers=self.SIGNIN_HEADERS, data=payload)
+        response.raise_for_status()
+
+        return response.json()["token"]
+
+
+class PooledTicktickClient(TicktickClient):
+    """TicktickClient that uses the shared transport and downloads the TickTick state at most once per run.
+
+    TicktickClient creates its API and downloads the tasks in its constructor, so the constructor is reproduced here
+    with the pooled API instead of replacing the session afterwards. This relies on the private parts of tickthon,
+    its version is pinned and tests/test_pooled_clients.py checks that they still match. Every TicktickClient method
+    downloads the whole state again, so the download goes through the run call memoizer, and clearing it starts a new
+    run.
+    """
+
+    def __init__(self, username: str, password: str, transport: HttpTransport, call_memoizer: CallMemoizer):
+        self.ticktick_api = PooledTicktickAPI(username, password, transport)
+        self.call_memoizer = call_memoizer
+        self.ticktick_data = {}
+        self.project_lists = []
+        self._cached_raw_active_tasks = []
+        self.all_active_tasks = []
+        self.active_tasks = []
+        self.completed_tasks = []
+        self.deleted_tasks = []
+        self.abandoned_tasks = []
+        self.weight_measurements = []
+        self.expense_logs = []
+        self.all_day_logs = []
+        self.day_logs = []
+
+    def _fetch_ticktick_data(self) -> tuple[dict, list]:
+        ticktick_data = self.ticktick_api.get(self.GET_STATE_URL).json()
+        return ticktick_data, list(self._get_folder_lists(ticktick_data["projectProfiles"]).values())
+
+    def _get_ticktick_data(self):
+        self.ticktick_data, self.project_lists = self.call_memoizer.call("get_ticktick_data",
+                                                                         self._fetch_ticktick_data)
+
+
+class PooledNotionAPI(NotionAPI):
+    """NotionAPI that sends its requests through the shared transport instead of the requests module functions.
+
+    NotionAPI sends its requests with the requests module functions, so every request method is reproduced here with
+    the session. nothion is pinned and tests/test_pooled_clients.py checks that no request method is left out.
+
+    The transport only retries idempotent methods, the database queries are POST requests that don't change anything,
+    so they are retried here. Page creations and updates are never retried, a retry after a success would duplicate
+    them.
+    """
+
+    def __init__(self, auth_secret: str, transport: HttpTransport):
+        super().__init__(auth_secret)
+        self.session = transport.create_session()
+        self.session.headers.update(self._default_headers())
+        self.retries = transport.retries
+        self.backoff_factor = transport.backoff_factor
+
+    def _post_query(self, url: str, payload: str) -> requests.Response:
+        for attempt in range(self.retries + 1):
+            is_last_attempt = attempt == self.retries
+            try:
+                response = self.session.post(url=url, data=payload)
+            except (requests.ConnectionError, requests.Timeout):
+                if is_last_attempt:
+                    raise
+            else:
+                if response.status_code not in RETRY_STATUS_CODES or is_last_attempt:
+                    return response
+
+            time.sleep(self.backoff_factor * 2 ** attempt)
+
+    def query_table(self, table_id: str, query: dict) -> List[dict]:
+        next_page_id = None
+        first_request = True
+        all_results = []
+
+        while next_page_id or first_request:
+            first_request = False
+
+            response = self._post_query(f"{self.DATABASE_URL}/{table_id}/query", json.dumps(query))
+            response.raise_for_status()
+
+            response_body = response.json()
+            all_results += response_body.get("results")
+            next_page_id = response_body.get("next_cursor")
+
+            if query.get("page_size") and len(all_results) >= query.get("page_size", 0):
+                break
+
+            if next_page_id:
+                query["start_cursor"] = next_page_id
+
+        return all_results
+
+    def create_table_entry(self, payload: str) -> dict:
+        response = self.session.post(url=self.PAGE_URL, data=payload)
+        response.raise_for_status()
+        return response.json()
+
+    def get_table_entry(self, page_id: str) -> dict:
+        response = self.session.get(url=f"{self.PAGE_URL}/{page_id}")
+        response.raise_for_status()
+        return response.json()
+
+    def update_table_entry(self, page_id: str, payload: str):
+        response = self.session.patch(url=f"{self.PAGE_URL}/{page_id}", data=payload)
+        response.raise_for_status()
+
+    def get_block_children(self, block_id: str) -> dict:
+        response = self.session.get(url=f"{self.BLOCK_URL}/{block_id}/children?page_size=100")
+        response.raise_for_status()
+        return response.json()
+
+
+class PooledNotionClient(NotionClient):
+    """NotionClient that uses the shared transport and the Notion databases of a profile.
+
+    NotionClient reads the database ids from the nothion global config, so the methods used by the bitacora that
+    query or create rows are reproduced here with the profile database ids. tests/test_pooled_clients.py checks that
+    they are still the methods that use the global ids.
+    """
+
+    def __init__(self, auth_secret: str, transport: HttpTransport,
+                 database_ids: NotionDatabaseIds = NotionDatabaseIds()):
+        super().__init__(auth_secret)
+        self.notion_api = PooledNotionAPI(auth_secret, transport)
+        self.database_ids = database_ids
+
+    def _create_notes_entry(self, payload: str) -> dict:
+        raw_payload = json.loads(payload)
+        raw_payload["parent"] = {"database_id": self.database_ids.notes}
+        return self.notion_api.create_table_entry(json.dumps(raw_payload))
+
+    def is_note_page_already_created(self, title: str, page_type: str) -> bool:
+        raw_notes = self.notion_api.query_table(self.database_ids.notes, NotionPayloads.get_note_page(title, page_type))
+        return len(raw_notes) > 0
+
+    def create_note_page(self, title: str, page_type: str, page_subtype: tuple[str], date: datetime,
+                         content: str) -> dict | None:
+        if not self.is_note_page_already_created(title, page_type):
+            return self._create_notes_entry(NotionPayloads.create_note_page(title, page_type, page_subtype, date,
+                                                                            content))
+        return None
+
+    def is_highlight_log_already_created(self, task: Task) -> bool:
+        raw_notes = self.notion_api.query_table(self.database_ids.notes, NotionPayloads.get_highlight_log(task))
+        return len(raw_notes) > 0
+
+    def add_highlight_log(self, log: Task) -> dict | None:
+        if not self.is_highlight_log_already_created(log):
+            return self._create_notes_entry(NotionPayloads.create_highlight_log(log))
+        return None
+
+    def get_stats_between_dates(self, start_date: datetime, end_date: datetime) -> List[PersonalStats]:
+        raw_stats = self.notion_api.query_table(self.database_ids.stats,
+                                                NotionPayloads.get_data_between_dates(start_date, end_date))
+        return self._parse_stats_rows(raw_stats)
+
+    def get_daily_journal_data(self, date: datetime) -> dict:
+        return self.notion_api.query_table(self.database_ids.notes, NotionPayloads.get_daily_journal_entry(date))[0]
+
+    def get_daily_journals_between_dates(self, start_date: datetime, end_date: datetime) -> List[dict]:
+        """Gets the page data of the daily journal entries of a date range with a single query."""
+        return self.notion_api.query_table(self.database_ids.notes, {"filter": {"and": [
+            {"property": "Type", "select": {"equals": "journal"}},
+            {"property": "Sub-type", "multi_select": {"contains": "daily"}},
+            {"property": "Due date", "date": {"on_or_after": start_date.strftime("%Y-%m-%d")}},
+            {"property": "Due date", "date": {"on_or_before": end_date.strftime("%Y-%m-%d")}}
+        ]}})
@@ -0,0 +1,159 @@
+import logging
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from PIL.Image import Image as ImageType
+
+from config import RENDER_SERVICE_HOST, RENDER_SERVICE_PORT, RENDER_SERVICE_WORKERS
+from src.cli_processor import get_week_start_date
+from src.data.profile_model import Profile, DEFAULT_PROFILE
+from src.image_processor import open_template
+from src.page_layout import get_page_layout
+from src.page_processor import PageProcessor
+from src.pdf_writer import encode_pages, get_pdf_bytes
+
+
+class RenderService:
+    """Renders pages as PDF files in a bounded worker pool, coalescing identical requests in flight.
+
+    Every worker thread builds its own PageProcessor on its first render, since the TickTick client keeps state
+    between calls, while the HTTP connection pools are shared through the process transport. Every render starts a new
+    run of the data processor, which drops the memoized calls and the stats that can still change.
+    """
+    PAGE_TYPES = ("daily", "weekly", "stats")
+
+    def __init__(self, profile: Profile = DEFAULT_PROFILE, max_workers: int = RENDER_SERVICE_WORKERS):
+        self.profile = profile
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="render-worker")
+        self._worker_data = threading.local()
+        self._in_flight: dict[tuple[str, str], Future] = {}
+        self._in_flight_lock = threading.Lock()
+
+    def _get_page_processor(self) -> PageProcessor:
+        if not hasattr(self._worker_data, "page_processor"):
+            self._worker_data.page_processor = PageProcessor(self.profile)
+        return self._worker_data.page_processor
+
+    def get_default_date(self, page_type: str) -> datetime:
+        """Get the date rendered when a request doesn't have one, the saturday of the week for weekly pages."""
+        current_date = self.profile.current_date
+        if page_type == "weekly":
+            return get_week_start_date(current_date)
+        return current_date
+
+    def _render_pages(self, page_type: str, page_date: datetime) -> tuple[bytes, list[str]]:
+        logging.info(f"Rendering {page_type} pages for {page_date.date()}")
+        page_processor = self._get_page_processor()
+        page_processor.data_processor.start_run()
+
+        pages: list[ImageType]
+        match page_type:
+            case "daily":
+                pages = [page_processor.generate_daily_tasks_page(page_date)]
+            case "weekly":
+                pages = [open_template(get_page_layout("weekly_reflection")["template"]),
+                         page_processor.generate_weekly_tasks_page(page_date)]
+            case _:
+                pages = [page_processor.generate_stats_page(page_date)]
+        page_processor.data_processor.log_call_summary()
+        degraded_sections = [section for page in pages for section in page.info.get("degraded_sections", [])]
+
+        return get_pdf_bytes(encode_pages(pages), resolution=700), degraded_sections
+
+    def render(self, page_type: str, page_date: datetime) -> Future:
+        """Render the pages of a type and date, joining the render in flight if the same pages are being rendered.
+
+        Args:
+            page_type: Type of the pages, one of PAGE_TYPES.
+            page_date: Date of the pages, the week start date for weekly pages.
+
+        Returns:
+            Future with the content of the PDF file and the sections rendered with degraded data.
+        """
+        if page_type not in self.PAGE_TYPES:
+            raise ValueError(f"Invalid page type {page_type}, valid types are {self.PAGE_TYPES}")
+
+        render_key = (page_type, page_date.strftime("%Y-%m-%d"))
+        with self._in_flight_lock:
+            render_future = self._in_flight.get(render_key)
+            if render_future is not None:
+                logging.info(f"Joining the render in flight of {page_type} pages for {render_key[1]}")
+                return render_future
+
+            render_future = self._executor.submit(self._render_pages, page_type, page_date)
+            self._in_flight[render_key] = render_future
+
+        render_future.add_done_callback(lambda _: self._forget_render(render_key))
+        return render_future
+
+    def _forget_render(self, render_key: tuple[str, str]):
+        with self._in_flight_lock:
+            self._in_flight.pop(render_key, None)
+
+    def shutdown(self):
+        self._executor.shutdown(wait=True)
+
+
+class RenderRequestHandler(BaseHTTPRequestHandler):
+    """Handles GET /<page_type>/<YYYY-MM-DD> returning the PDF of the pages, the date is optional.
+
+    Sections rendered with last known or empty data are listed in the X-Degraded-Sections header.
+    """
+    render_service: RenderService
+
+    def do_GET(self):
+        path_parts = [path_part for path_part in self.path.split("?")[0].split("/") if path_part]
+        if not path_parts or len(path_parts) > 2 or path_parts[0] not in RenderService.PAGE_TYPES:
+            self.send_error(HTTPStatus.NOT_FOUND, f"Valid pages are {RenderService.PAGE_TYPES}")
+            return
+
+        page_type = path_parts[0]
+        try:
+            page_date = (datetime.strptime(path_parts[1], "%Y-%m-%d") if len(path_parts) == 2
+                         else self.render_service.get_default_date(page_type))
+        except ValueError:
+            self.send_error(HTTPStatus.BAD_REQUEST, "Dates must have the format YYYY-MM-DD")
+            return
+
+        try:
+            pdf_content, degraded_sections = self.render_service.render(page_type, page_date).result()
+        except Exception:
+            logging.exception(f"Could not render the {page_type} pages for {page_date.date()}")
+            self.send_error(HTTPStatus.INTERNAL_SERVER_ERROR, "Could not render the pages")
+            return
+
+        self.send_response(HTTPStatus.OK)
+        self.send_header("Content-Type", "application/pdf")
+        self.send_header("Content-Length", str(len(pdf_content)))
+        if degraded_sections:
+            self.send_header("X-Degraded-Sections", ",".join(degraded_sections))
+        self.send_header("Content-Disposition",
+                         f'inline; filename="bitacora-{page_type}-{page_date.strftime("%d-%b-%Y").lower()}.pdf"')
+        self.end_headers()
+        self.wfile.write(pdf_content)
+
+
+def serve_pages(host: str = RENDER_SERVICE_HOST, port: int = RENDER_SERVICE_PORT,
+                max_workers: int = RENDER_SERVICE_WORKERS, profile: Profile = DEFAULT_PROFILE):
+    """Serve the rendered pages over HTTP until the process is interrupted.
+
+    Args:
+        host: Interface to listen on.
+        port: Port to listen on.
+        max_workers: Maximum number of renders running at the same time.
+        profile: Profile whose pages are rendered.
+    """
+    render_service = RenderService(profile, max_workers)
+    handler_class = type("BoundRenderRequestHandler", (RenderRequestHandler,), {"render_service": render_service})
+
+    with ThreadingHTTPServer((host, port), handler_class) as http_server:
+        logging.info(f"Serving pages on http://{host}:{port}")
+        try:
+            http_server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            render_service.shutdown()
@@ -0,0 +1,126 @@
+from datetime import datetime
+
+import numpy as np
+from attr import define
+from nothion import PersonalStats
+
+STAT_NAMES = ("work_time", "focus_time", "sleep_time", "leisure_time")
+
+
+@define
+class StatsSummary:
+    """Aggregated personal stats of a date range, every array has one column per stat in STAT_NAMES.
+
+    Attributes:
+        start_date: First date of the range.
+        daily_values: Stats per day, shape (days, stats), days without stats are NaN.
+        rolling_means: Trailing rolling average per day, shape (days, stats).
+        weekday_means: Average per weekday starting on monday, shape (7, stats).
+        means: Average over the days with stats.
+        totals: Sum over the whole range.
+        longest_streaks: Longest run of consecutive days with the stat above zero.
+        current_streaks: Run of consecutive days with the stat above zero that ends on the last day.
+    """
+    start_date: datetime
+    daily_values: np.ndarray
+    rolling_means: np.ndarray
+    weekday_means: np.ndarray
+    means: np.ndarray
+    totals: np.ndarray
+    longest_streaks: np.ndarray
+    current_streaks: np.ndarray
+
+
+def _get_rolling_means(daily_values: np.ndarray, window_days: int) -> np.ndarray:
+    """Trailing rolling average that ignores the days without stats.
+
+    Args:
+        daily_values: Stats per day with NaN for the days without stats.
+        window_days: Number of days of the window.
+
+    Returns:
+        Rolling averages, NaN where the window doesn't have any stats.
+    """
+    is_known = ~np.isnan(daily_values)
+    padding = np.zeros((1, daily_values.shape[1]))
+    values_sum = np.concatenate((padding, np.cumsum(np.where(is_known, daily_values, 0), axis=0)))
+    known_count = np.concatenate((padding, np.cumsum(is_known, axis=0)))
+
+    window_starts = np.maximum(np.arange(1, daily_values.shape[0] + 1) - window_days, 0)
+    window_sum = values_sum[1:] - values_sum[window_starts]
+    window_count = known_count[1:] - known_count[window_starts]
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return np.where(window_count > 0, window_sum / window_count, np.nan)
+
+
+def _get_streaks(daily_values: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Longest and current runs of consecutive days with the stats above zero.
+
+    Args:
+        daily_values: Stats per day with NaN for the days without stats.
+
+    Returns:
+        Tuple with the longest and the current streak of every stat.
+    """
+    is_active = np.nan_to_num(daily_values) > 0
+    padding = np.zeros((1, daily_values.shape[1]), dtype=np.int8)
+    run_edges = np.diff(np.concatenate((padding, is_active.astype(np.int8), padding)), axis=0)
+
+    run_stats, run_starts = np.nonzero(run_edges.T == 1)
+    _, run_ends = np.nonzero(run_edges.T == -1)
+    run_lengths = run_ends - run_starts
+
+    longest_streaks = np.zeros(daily_values.shape[1], dtype=int)
+    np.maximum.at(longest_streaks, run_stats, run_lengths)
+
+    last_inactive_day = np.where(is_active, -1, np.arange(daily_values.shape[0])[:, None]).max(axis=0)
+    current_streaks = daily_values.shape[0] - 1 - last_inactive_day
+
+    return longest_streaks, current_streaks
+
+
+def aggregate_stats(stats: list[PersonalStats], start_date: datetime, end_date: datetime,
+                    rolling_days: int = 7) -> StatsSummary:
+    """Aggregate the stats of a date range in a single vectorized pass.
+
+    Args:
+        stats: Stats of the range as returned by Notion, in any order.
+        start_date: First date of the range.
+        end_date: Last date of the range, inclusive.
+        rolling_days: Window of the rolling averages in days.
+
+    Returns:
+        Aggregated stats of the range.
+    """
+    range_days = (end_date.date() - start_date.date()).days + 1
+    stats_days = np.array([(datetime.strptime(day_stats.date[:10], "%Y-%m-%d").date() - start_date.date()).days
+                           for day_stats in stats], dtype=int)
+    stats_values = np.array([[getattr(day_stats, stat_name) for stat_name in STAT_NAMES] for day_stats in stats],
+                            dtype=float).reshape(-1, len(STAT_NAMES))
+
+    in_range = (stats_days >= 0) & (stats_days < range_days)
+    daily_values = np.full((range_days, len(STAT_NAMES)), np.nan)
+    daily_values[stats_days[in_range]] = stats_values[in_range]
+
+    is_known = ~np.isnan(daily_values)
+    known_values = np.where(is_known, daily_values, 0)
+    weekdays = (start_date.weekday() + np.arange(range_days)) % 7
+    weekday_sums = np.zeros((7, len(STAT_NAMES)))
+    weekday_counts = np.zeros((7, len(STAT_NAMES)))
+    np.add.at(weekday_sums, weekdays, known_values)
+    np.add.at(weekday_counts, weekdays, is_known)
+
+    totals = known_values.sum(axis=0)
+    known_days = is_known.sum(axis=0)
+    longest_streaks, current_streaks = _get_streaks(daily_values)
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return StatsSummary(start_date=start_date,
+                            daily_values=daily_values,
+                            rolling_means=_get_rolling_means(daily_values, rolling_days),
+                            weekday_means=np.where(weekday_counts > 0, weekday_sums / weekday_counts, np.nan),
+                            means=np.where(known_days > 0, totals / known_days, np.nan),
+                            totals=totals,
+                            longest_streaks=longest_streaks,
+                            current_streaks=current_streaks)
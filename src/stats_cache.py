@@ -0,0 +1,147 @@
+import json
+import logging
+import os
+from datetime import datetime, timedelta
+
+from attr import asdict
+from nothion import NotionClient, PersonalStats
+
+from config import CURRENT_DATE, STATS_CACHE_FILE, STATS_REFRESH_DAYS
+
+stats_date_format = "%Y-%m-%d"
+
+
+class StatsCache:
+    """Range-prefetched cache for the Notion personal stats.
+
+    Stats are fetched with a single range query for every missing date, days older than ``STATS_REFRESH_DAYS`` are
+    considered finalized and persisted in ``STATS_CACHE_FILE``, recent days are kept in memory only for the current run
+    and are dropped by ``start_run``.
+    """
+
+    def __init__(self, notion_client: NotionClient, cache_file: str = STATS_CACHE_FILE,
+                 current_date: datetime = CURRENT_DATE):
+        self.notion_client = notion_client
+        self.current_date = current_date
+        self.cache_file = cache_file
+        self._finalized_stats = self._load_finalized_stats()
+        self._recent_stats: dict[str, PersonalStats] = {}
+        self._fetched_dates: set[str] = set()
+
+    def _load_finalized_stats(self) -> dict[str, PersonalStats]:
+        """Load the finalized stats persisted in the cache file.
+
+        Returns:
+            Dictionary with the persisted stats indexed by date in format YYYY-MM-DD.
+        """
+        if not os.path.exists(self.cache_file):
+            return {}
+
+        try:
+            with open(self.cache_file, encoding="utf-8") as cache_file:
+                raw_stats = json.load(cache_file)
+        except (OSError, json.JSONDecodeError):
+            logging.warning(f"Could not read stats cache {self.cache_file}, ignoring it")
+            return {}
+
+        return {date: PersonalStats(**stats) for date, stats in raw_stats.items()}
+
+    def _save_finalized_stats(self):
+        """Persist the finalized stats in the cache file."""
+        os.makedirs(os.path.dirname(self.cache_file) or ".", exist_ok=True)
+        with open(self.cache_file, "w", encoding="utf-8") as cache_file:
+            json.dump({date: asdict(stats) for date, stats in self._finalized_stats.items()}, cache_file, indent=2)
+
+    def _is_finalized(self, date: datetime) -> bool:
+        """Check if the stats of a date can't change anymore.
+
+        Args:
+            date: Date to check.
+
+        Returns:
+            True if the date is older than the refresh window.
+        """
+        return date.date() < (self.current_date - timedelta(days=STATS_REFRESH_DAYS)).date()
+
+    def start_run(self, current_date: datetime):
+        """Start a new run, the stats of the days that are not finalized are fetched again when requested.
+
+        Args:
+            current_date: Current date of the new run, it moves the refresh window in long running processes.
+        """
+        self.current_date = current_date
+        self._recent_stats.clear()
+        self._fetched_dates = {date for date in self._fetched_dates
+                               if self._is_finalized(datetime.strptime(date, stats_date_format))}
+
+    def _get_cached_stats(self, date: datetime) -> PersonalStats | None:
+        date_key = date.strftime(stats_date_format)
+        return self._finalized_stats.get(date_key) or self._recent_stats.get(date_key)
+
+    def prefetch(self, start_date: datetime, end_date: datetime):
+        """Fetch the stats of every date in a range that is not cached yet with a single Notion query.
+
+        Args:
+            start_date: First date of the range.
+            end_date: Last date of the range, inclusive.
+        """
+        missing_dates = [start_date + timedelta(days=delta_days)
+                         for delta_days in range((end_date.date() - start_date.date()).days + 1)]
+        missing_dates = [date for date in missing_dates if self._get_cached_stats(date) is None
+                         and date.strftime(stats_date_format) not in self._fetched_dates]
+        if not missing_dates:
+            return
+
+        logging.info(f"Fetching stats between {missing_dates[0]} and {missing_dates[-1]}")
+        fetched_stats = self.notion_client.get_stats_between_dates(missing_dates[0], missing_dates[-1])
+        self._fetched_dates.update(date.strftime(stats_date_format) for date in missing_dates)
+
+        has_new_finalized_stats = False
+        for stats in fetched_stats:
+            stats_date = datetime.strptime(stats.date[:10], stats_date_format)
+            if self._is_finalized(stats_date):
+                self._finalized_stats[stats_date.strftime(stats_date_format)] = stats
+                has_new_finalized_stats = True
+            else:
+                self._recent_stats[stats_date.strftime(stats_date_format)] = stats
+
+        if has_new_finalized_stats:
+            self._save_finalized_stats()
+
+    def get_stats_between_dates(self, start_date: datetime, end_date: datetime) -> list[PersonalStats]:
+        """Get the stats of every date in a range, fetching the missing ones first.
+
+        Args:
+            start_date: First date of the range.
+            end_date: Last date of the range, inclusive.
+
+        Returns:
+            List of stats ordered by date, dates without stats in Notion are skipped.
+        """
+        self.prefetch(start_date, end_date)
+
+        range_stats = []
+        for delta_days in range((end_date.date() - start_date.date()).days + 1):
+            stats = self._get_cached_stats(start_date + timedelta(days=delta_days))
+            if stats is not None:
+                range_stats.append(stats)
+
+        return range_stats
+
+    def get_day_stats(self, date: datetime) -> PersonalStats:
+        """Get the stats of a single date.
+
+        Args:
+            date: Date to get the stats for.
+
+        Returns:
+            Stats for the date, empty stats if the date doesn't have a row in Notion.
+        """
+        self.prefetch(date, date)
+
+        stats = self._get_cached_stats(date)
+        if stats is None:
+            logging.warning(f"Stats for date {date} not found")
+            stats = PersonalStats(date=date.strftime(stats_date_format), work_time=0, leisure_time=0, focus_time=0)
+
+        return stats
@@ -0,0 +1,45 @@
+from datetime import datetime, timedelta
+
+import pytest
+from nothion import PersonalStats
+
+from src.data import profile_model
+from src.data.profile_model import Profile
+from src.page_processor import PageProcessor
+
+
+class StubNotionClient:
+    """Notion client that returns the same stats for every date and counts the stats queries."""
+
+    def __init__(self):
+        self.work_time = 1.0
+        self.calls = 0
+
+    def get_stats_between_dates(self, start_date: datetime, end_date: datetime) -> list[PersonalStats]:
+        self.calls += 1
+        return [PersonalStats(date=(start_date + timedelta(days=delta_days)).strftime("%Y-%m-%d"),
+                              work_time=self.work_time, leisure_time=0, focus_time=0)
+                for delta_days in range((end_date.date() - start_date.date()).days + 1)]
+
+    def get_daily_journal_data(self, date: datetime) -> dict:
+        return {"url": f"https://notion.so/journal-{date.strftime('%Y-%m-%d')}"}
+
+    def get_daily_journals_between_dates(self, start_date: datetime, end_date: datetime) -> list[dict]:
+        return []
+
+
+@pytest.fixture
+def stub_notion_client() -> StubNotionClient:
+    return StubNotionClient()
+
+
+@pytest.fixture
+def page_processor(tmp_path, monkeypatch, stub_notion_client) -> PageProcessor:
+    """Page processor of a test profile whose Notion client is the stub and whose caches live in tmp_path."""
+    monkeypatch.setattr(profile_model, "CACHE_FOLDER", str(tmp_path))
+    monkeypatch.setenv("TEST_OPENAI_API_KEY", "test")
+
+    page_processor = PageProcessor(Profile(name="test", credentials_env_prefix="TEST_"))
+    page_processor.data_processor.notion_client = stub_notion_client
+    page_processor.data_processor.stats_cache.notion_client = stub_notion_client
+    return page_processor
@@ -0,0 +1,22 @@
+import os
+
+from PIL import Image
+
+from src.asset_pack import AssetPack, build_asset_pack
+
+IMAGE_PATH = "designs/template.png"
+
+
+def test_packed_image_is_current_until_its_content_changes(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    os.makedirs("designs")
+    Image.new("L", (64, 32), 200).save(IMAGE_PATH)
+    build_asset_pack("assets.pack", ("designs/*.png",))
+
+    os.utime(IMAGE_PATH, ns=(0, 0))
+    asset_pack = AssetPack("assets.pack")
+    assert asset_pack.has_image(IMAGE_PATH)
+    assert asset_pack.get_image(IMAGE_PATH).tobytes() == Image.open(IMAGE_PATH).tobytes()
+
+    Image.new("L", (64, 32), 100).save(IMAGE_PATH)
+    assert not AssetPack("assets.pack").has_image(IMAGE_PATH)
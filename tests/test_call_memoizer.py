@@ -0,0 +1,100 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from src.call_memoizer import CallMemoizer
+
+CONCURRENT_CALLS = 8
+
+
+def wait_for(condition, timeout_seconds: float = 5):
+    deadline = time.monotonic() + timeout_seconds
+    while not condition():
+        assert time.monotonic() < deadline, "The condition was not met in time"
+        time.sleep(0.01)
+
+
+def test_concurrent_calls_run_the_function_once():
+    call_memoizer = CallMemoizer()
+    release_call = threading.Event()
+    function_calls = []
+
+    def get_tasks(date):
+        function_calls.append(date)
+        release_call.wait(5)
+        return [f"task of {date}"]
+
+    with ThreadPoolExecutor(CONCURRENT_CALLS) as executor:
+        futures = [executor.submit(call_memoizer.call, "get_tasks", get_tasks, "2024-05-01")
+                   for _ in range(CONCURRENT_CALLS)]
+        wait_for(lambda: call_memoizer.hits["get_tasks"] == CONCURRENT_CALLS - 1)
+        release_call.set()
+        results = [future.result(5) for future in futures]
+
+    assert function_calls == ["2024-05-01"]
+    assert all(result is results[0] for result in results)
+    assert call_memoizer.get_summary() == {"get_tasks": (CONCURRENT_CALLS - 1, 1)}
+
+
+def test_calls_with_other_arguments_are_memoized_apart():
+    call_memoizer = CallMemoizer()
+
+    first_stats = call_memoizer.call("get_stats", lambda date: {"date": date}, "2024-05-01")
+    second_stats = call_memoizer.call("get_stats", lambda date: {"date": date}, "2024-05-02")
+
+    assert first_stats == {"date": "2024-05-01"} and second_stats == {"date": "2024-05-02"}
+    assert call_memoizer.get_summary() == {"get_stats": (0, 2)}
+
+
+def test_failed_calls_are_not_memoized():
+    call_memoizer = CallMemoizer()
+    responses = iter([ConnectionError("TickTick is down"), ["task"]])
+
+    def get_tasks():
+        response = next(responses)
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+    with pytest.raises(ConnectionError):
+        call_memoizer.call("get_tasks", get_tasks)
+
+    assert call_memoizer.call("get_tasks", get_tasks) == ["task"]
+    assert call_memoizer.call("get_tasks", get_tasks) == ["task"]
+    assert call_memoizer.get_summary() == {"get_tasks": (1, 2)}
+
+
+def test_waiting_calls_get_the_error_of_the_failed_call():
+    call_memoizer = CallMemoizer()
+    release_call = threading.Event()
+
+    def get_tasks():
+        release_call.wait(5)
+        raise ConnectionError("TickTick is down")
+
+    with ThreadPoolExecutor(2) as executor:
+        futures = [executor.submit(call_memoizer.call, "get_tasks", get_tasks) for _ in range(2)]
+        wait_for(lambda: call_memoizer.hits["get_tasks"] == 1)
+        release_call.set()
+
+        for future in futures:
+            with pytest.raises(ConnectionError):
+                future.result(5)
+
+
+def test_clear_forgets_the_memoized_results():
+    call_memoizer = CallMemoizer()
+    function_calls = []
+
+    def get_tasks():
+        function_calls.append(len(function_calls))
+        return len(function_calls)
+
+    assert call_memoizer.call("get_tasks", get_tasks) == 1
+    call_memoizer.clear()
+
+    assert call_memoizer.get_summary() == {}
+    assert call_memoizer.call("get_tasks", get_tasks) == 2
+    assert call_memoizer.get_summary() == {"get_tasks": (0, 1)}
@@ -0,0 +1,16 @@
+from src.page_layout import get_page_layout
+
+
+def test_logs_fill_the_logs_page_before_the_continuation_pages(page_processor):
+    consumed_logs = []
+    logs = (consumed_logs.append(log_number) or f"10:00 am log {log_number}" for log_number in range(70))
+    page_processor.data_processor.get_day_logs = lambda date: logs
+    first_page_rows = get_page_layout("logs")["logs"]["max_rows"]
+    continuation_page_rows = get_page_layout("logs_continuation")["logs"]["max_rows"]
+
+    logs_pages = page_processor.generate_logs_pages(page_processor.profile.current_date, scale=0.1)
+    next(logs_pages)
+    assert len(consumed_logs) == first_page_rows
+
+    assert len(list(logs_pages)) == -(-(70 - first_page_rows) // continuation_page_rows)
+    assert len(consumed_logs) == 70
@@ -0,0 +1,60 @@
+import os
+from datetime import datetime
+
+import pytest
+from PIL import Image, ImageDraw
+
+from src.page_archive import PageArchive, migrate_old_pages_folder
+
+PAGE_DATE = datetime(2023, 5, 20)
+
+
+def create_page(ink_width: int) -> Image.Image:
+    page = Image.new("L", (400, 600), 230)
+    ImageDraw.Draw(page).rectangle((20, 20, 20 + ink_width, 80), fill=30)
+    return page
+
+
+@pytest.fixture
+def page_archive(tmp_path) -> PageArchive:
+    return PageArchive(str(tmp_path / "old_pages.bin"), str(tmp_path / "old_pages_index.json"))
+
+
+def test_add_page_stores_a_compact_bilevel_page(page_archive):
+    page = create_page(100)
+    page_archive.add_page(PAGE_DATE, "task", page)
+
+    archived_page = PageArchive(page_archive.archive_file, page_archive.index_file).load_page(PAGE_DATE, "task")
+
+    assert archived_page.mode == "1"
+    assert archived_page.tobytes() == PageArchive.convert_page(page).tobytes()
+    assert os.path.getsize(page_archive.archive_file) < len(page.tobytes()) / 100
+
+
+def test_load_page_reads_a_single_page(page_archive):
+    page_archive.add_page(PAGE_DATE, "task", create_page(100))
+    page_archive.add_page(PAGE_DATE, "journal", create_page(200))
+
+    assert page_archive.is_page_archived(PAGE_DATE, "journal", create_page(200))
+    assert not page_archive.is_page_archived(PAGE_DATE, "journal", create_page(100))
+    with pytest.raises(FileNotFoundError):
+        page_archive.load_page(PAGE_DATE, "recap")
+
+
+def test_migration_resumes_and_verifies_pages(tmp_path, page_archive):
+    old_pages_folder = tmp_path / "old_pages"
+    old_pages_folder.mkdir()
+    for page_kind, ink_width in (("task", 100), ("journal", 200), ("recap", 300)):
+        create_page(ink_width).save(old_pages_folder / f"20-may-2023-old-{page_kind}-page.png")
+    page_archive.add_page(PAGE_DATE, "journal", create_page(200))
+
+    verified_files = migrate_old_pages_folder(str(old_pages_folder), page_archive)
+
+    assert len(verified_files) == 3
+    resumed_archive = PageArchive(page_archive.archive_file, page_archive.index_file)
+    assert resumed_archive.get_dates() == [PAGE_DATE]
+    assert all(resumed_archive.has_page(PAGE_DATE, page_kind) for page_kind in PageArchive.PAGE_KINDS)
+
+    archive_size = os.path.getsize(page_archive.archive_file)
+    assert migrate_old_pages_folder(str(old_pages_folder), resumed_archive) == verified_files
+    assert os.path.getsize(page_archive.archive_file) == archive_size
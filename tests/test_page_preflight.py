@@ -0,0 +1,54 @@
+from PIL import Image, ImageDraw
+
+from src.page_preflight import PreflightAction, PreflightPolicy, preflight_pages
+
+DROP_POLICY = PreflightPolicy(blank_action=PreflightAction.DROP, duplicate_action=PreflightAction.DROP)
+
+
+def create_page(ink_width: int = 0) -> Image.Image:
+    page = Image.new("L", (200, 300), 255)
+    if ink_width > 0:
+        ImageDraw.Draw(page).rectangle((20, 20, 20 + ink_width, 60), fill=0)
+    return page
+
+
+def test_blank_and_duplicated_pages_are_flagged_by_default(tmp_path):
+    pages = [create_page(40), create_page(40), create_page()]
+
+    kept_pages, report = preflight_pages(pages, PreflightPolicy(), str(tmp_path / "printed_pages.json"))
+
+    assert kept_pages == pages
+    assert [check.action for check in report.checks] == [PreflightAction.KEEP, PreflightAction.FLAG,
+                                                         PreflightAction.FLAG]
+    assert report.checks[1].duplicate_of == 1
+    assert report.checks[2].is_blank
+
+
+def test_drop_policy_drops_blank_and_duplicated_pages(tmp_path):
+    pages = [create_page(40), create_page(40), create_page(), create_page(80)]
+
+    kept_pages, report = preflight_pages(pages, DROP_POLICY, str(tmp_path / "printed_pages.json"))
+
+    assert kept_pages == [pages[0], pages[3]]
+    assert [check.action for check in report.checks] == [PreflightAction.KEEP, PreflightAction.DROP,
+                                                         PreflightAction.DROP, PreflightAction.KEEP]
+
+
+def test_degraded_page_is_never_blank(tmp_path):
+    degraded_page = create_page()
+    degraded_page.info["degraded_sections"] = ["stats"]
+
+    kept_pages, report = preflight_pages([degraded_page], DROP_POLICY, str(tmp_path / "printed_pages.json"))
+
+    assert kept_pages == [degraded_page]
+    assert not report.checks[0].is_blank
+
+
+def test_save_pages_as_pdf_keeps_blank_pages_without_a_policy(tmp_path):
+    from src.page_processor import PageProcessor
+
+    page_title = str(tmp_path / "pages")
+    PageProcessor.save_pages_as_pdf(page_title, [create_page()], printed_pages_file=str(tmp_path / "printed.json"))
+
+    assert (tmp_path / "pages.pdf").exists()
+    assert not (tmp_path / "printed.json").exists()
@@ -0,0 +1,18 @@
+from PIL import ImageChops
+
+from src.page_watcher import PageWatcher
+
+
+def test_notion_refresh_renders_the_new_stats(page_processor, stub_notion_client, tmp_path):
+    page_date = page_processor.profile.current_date
+    page_watcher = PageWatcher(page_processor, page_date, str(tmp_path / "watch"))
+    stats_page = next(watched_page for watched_page in page_watcher.watched_pages if watched_page.source == "notion")
+
+    assert page_watcher._refresh_pages("notion")
+    first_page = stats_page.page.copy()
+    assert not page_watcher._refresh_pages("notion")
+
+    stub_notion_client.work_time = 5.0
+    assert page_watcher._refresh_pages("notion")
+    assert ImageChops.difference(first_page.convert("L"), stats_page.page.convert("L")).getbbox() is not None
+    assert stats_page.page.tobytes() == stats_page.display_list.render().tobytes()
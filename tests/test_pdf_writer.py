@@ -0,0 +1,88 @@
+import io
+import re
+import struct
+import zlib
+
+import pytest
+from PIL import Image, ImageChops, ImageDraw
+
+from src.pdf_writer import PdfCodec, encode_page, write_pdf_to_stream
+
+image_object_pattern = re.compile(rb"<< /Type /XObject /Subtype /Image /Width (\d+) /Height (\d+)"
+                                  rb" /ColorSpace /(\w+) /BitsPerComponent (\d+) /Filter /(\w+)"
+                                  rb"(?: /DecodeParms << /K -1 /BlackIs1 true /Columns \d+ /Rows \d+ >>)?"
+                                  rb" /Length (\d+) >>\nstream\n")
+
+
+def create_page(mode: str) -> Image.Image:
+    page = Image.new(mode, (96, 64), "white")
+    ImageDraw.Draw(page).rectangle((10, 12, 50, 40), fill="black")
+    return page
+
+
+def wrap_ccitt_stream(stream: bytes, width: int, height: int) -> bytes:
+    """Wrap a CCITT group 4 stream in a single strip TIFF, with the same bit meaning as BlackIs1 true in a PDF."""
+    tags = [(256, 4, width), (257, 4, height), (258, 3, 1), (259, 3, 4), (262, 3, 1), (273, 4, 0), (277, 3, 1),
+            (278, 4, height), (279, 4, len(stream))]
+    strip_offset = 8 + 2 + len(tags) * 12 + 4
+    ifd = struct.pack("<H", len(tags)) + b"".join(
+        struct.pack("<HHII", tag, tag_type, 1, strip_offset if tag == 273 else value)
+        for tag, tag_type, value in tags) + struct.pack("<I", 0)
+    return b"II*\0" + struct.pack("<I", 8) + ifd + stream
+
+
+def read_pdf_pages(pdf: bytes) -> list[tuple[str, Image.Image]]:
+    """Decode the page images of a PDF written by write_pdf_to_stream, with their filter."""
+    pages = []
+    for image_object in image_object_pattern.finditer(pdf):
+        width, height = int(image_object.group(1)), int(image_object.group(2))
+        color_space, bits_per_component = image_object.group(3), int(image_object.group(4))
+        codec = image_object.group(5).decode()
+        stream = pdf[image_object.end():image_object.end() + int(image_object.group(6))]
+
+        mode = "1" if bits_per_component == 1 else "RGB" if color_space == b"DeviceRGB" else "L"
+        match codec:
+            case PdfCodec.FLATE.value:
+                page = Image.frombytes(mode, (width, height), zlib.decompress(stream))
+            case PdfCodec.DCT.value:
+                page = Image.open(io.BytesIO(stream))
+            case _:
+                page = Image.open(io.BytesIO(wrap_ccitt_stream(stream, width, height)))
+        page.load()
+        pages.append((codec, page))
+
+    return pages
+
+
+@pytest.mark.parametrize("codec, mode", [(PdfCodec.FLATE, "RGB"), (PdfCodec.FLATE, "L"), (PdfCodec.DCT, "RGB"),
+                                         (PdfCodec.CCITT, "1"), (PdfCodec.AUTO, "1")])
+def test_pages_round_trip(codec, mode):
+    pages = [create_page(mode), create_page(mode).rotate(180)]
+    pdf_buffer = io.BytesIO()
+
+    write_pdf_to_stream(pdf_buffer, [encode_page(page, codec, quality=95) for page in pages])
+    pdf = pdf_buffer.getvalue()
+
+    assert pdf.startswith(b"%PDF-1.4") and pdf.endswith(b"%%EOF\n")
+    assert re.search(rb"/Type /Pages /Count 2 ", pdf)
+    read_pages = read_pdf_pages(pdf)
+    assert [read_codec for read_codec, _ in read_pages] == [PdfCodec.CCITT.value if codec == PdfCodec.AUTO
+                                                            else codec.value] * 2
+    for page, (_, read_page) in zip(pages, read_pages):
+        assert read_page.size == page.size and read_page.mode == page.mode
+        if codec == PdfCodec.DCT:
+            assert max(band_max for _, band_max in ImageChops.difference(page, read_page).getextrema()) < 32
+        else:
+            assert read_page.tobytes() == page.tobytes()
+
+
+def test_cross_reference_table_points_at_every_object():
+    pdf_buffer = io.BytesIO(b"prefix")
+    pdf_buffer.seek(0, io.SEEK_END)
+    write_pdf_to_stream(pdf_buffer, [encode_page(create_page("1"))])
+    pdf = pdf_buffer.getvalue()[len(b"prefix"):]
+
+    xref_offset = int(re.search(rb"startxref\n(\d+)\n", pdf).group(1))
+    object_offsets = re.findall(rb"(\d{10}) 00000 n ", pdf[xref_offset:])
+    for object_id, object_offset in enumerate(object_offsets, start=1):
+        assert pdf[int(object_offset):].startswith(f"{object_id} 0 obj\n".encode())
@@ -0,0 +1,107 @@
+import inspect
+import json
+from datetime import datetime
+
+from nothion._notion_api import NotionAPI
+from tickthon import Task, ticktick_client
+from tickthon._ticktick_api import TicktickAPI
+from tickthon.ticktick_client import TicktickClient
+
+from src.call_memoizer import CallMemoizer
+from src.data.profile_model import NotionDatabaseIds
+from src.http_transport import HttpTransport
+from src.pooled_clients import PooledNotionAPI, PooledNotionClient, PooledTicktickAPI, PooledTicktickClient
+
+PROFILE_DATABASE_IDS = NotionDatabaseIds(notes="profile-notes", stats="profile-stats")
+
+
+class StubTicktickAPI:
+    def __init__(self, *args):
+        self.state_requests = 0
+
+    def get(self, url: str):
+        self.state_requests += 1
+        return StubResponse({"projectProfiles": [], "syncTaskBean": {"update": []}})
+
+
+class StubNotionAPI:
+    """Notion API that records the databases it's asked to query or to create rows in."""
+
+    def __init__(self, query_results: list[dict]):
+        self.query_results = query_results
+        self.database_ids = []
+
+    def query_table(self, table_id: str, query: dict) -> list[dict]:
+        self.database_ids.append(table_id)
+        return self.query_results
+
+    def create_table_entry(self, payload: str) -> dict:
+        self.database_ids.append(json.loads(payload)["parent"]["database_id"])
+        return {}
+
+    def get_block_children(self, block_id: str) -> dict:
+        return {"results": []}
+
+
+class StubResponse:
+    def __init__(self, body: dict):
+        self.body = body
+
+    def json(self) -> dict:
+        return self.body
+
+
+def test_ticktick_api_constructor_matches_the_pooled_one(monkeypatch):
+    monkeypatch.setattr(TicktickAPI, "login", lambda self, user, password: "token")
+    ticktick_api = TicktickAPI("user", "password")
+
+    assert set(vars(ticktick_api)) == {"session", "auth_token"}
+    assert isinstance(inspect.getattr_static(PooledTicktickAPI, "auth_token"), property)
+
+
+def test_ticktick_client_constructor_matches_the_pooled_one(monkeypatch):
+    monkeypatch.setattr(ticktick_client, "TicktickAPI", StubTicktickAPI)
+    ticktick = TicktickClient("user", "password")
+    pooled_ticktick = PooledTicktickClient("user", "password", HttpTransport(), CallMemoizer())
+
+    assert set(vars(pooled_ticktick)) - {"call_memoizer"} == set(vars(ticktick))
+    assert "self._get_ticktick_data()" in inspect.getsource(TicktickClient._get_all_tasks)
+
+
+def test_ticktick_state_is_downloaded_once_per_run(monkeypatch):
+    monkeypatch.setattr(TicktickClient, "_get_folder_lists", staticmethod(lambda lists: {}))
+    call_memoizer = CallMemoizer()
+    pooled_ticktick = PooledTicktickClient("user", "password", HttpTransport(), call_memoizer)
+    pooled_ticktick.ticktick_api = StubTicktickAPI()
+
+    pooled_ticktick._get_all_tasks()
+    pooled_ticktick._get_all_tasks()
+    assert pooled_ticktick.ticktick_api.state_requests == 1
+
+    call_memoizer.clear()
+    pooled_ticktick._get_all_tasks()
+    assert pooled_ticktick.ticktick_api.state_requests == 2
+
+
+def test_notion_api_request_methods_are_all_pooled():
+    request_methods = {name for name, method in vars(NotionAPI).items()
+                       if callable(method) and not name.startswith("_")}
+
+    assert request_methods <= set(vars(PooledNotionAPI))
+    assert set(vars(NotionAPI("secret"))) == {"_auth_secret"}
+
+
+def test_notion_client_uses_the_profile_databases():
+    notion_client = PooledNotionClient("secret", HttpTransport(), PROFILE_DATABASE_IDS)
+    date = datetime(2024, 5, 20)
+
+    notion_client.notion_api = StubNotionAPI([])
+    notion_client.get_stats_between_dates(date, date)
+    notion_client.get_daily_journals_between_dates(date, date)
+    notion_client.create_note_page("Recap", "recap", ("daily",), date, "content")
+    notion_client.add_highlight_log(Task(title="log", ticktick_id="id", ticktick_etag="etag",
+                                         created_date="2024-05-20T10:00:00+00:00"))
+    notion_client.notion_api.query_results = [{"id": "journal"}]
+    notion_client.get_daily_journal_content(date)
+
+    assert notion_client.notion_api.database_ids == ["profile-stats"] + ["profile-notes"] * 6
@@ -0,0 +1,16 @@
+from src.render_service import RenderService
+
+
+def test_every_request_renders_the_current_stats(page_processor, stub_notion_client):
+    render_service = RenderService(page_processor.profile, max_workers=1)
+    render_service._get_page_processor = lambda: page_processor
+    page_date = page_processor.profile.current_date
+
+    try:
+        first_pdf, _ = render_service.render("stats", page_date).result()
+        stub_notion_client.work_time = 5.0
+        second_pdf, _ = render_service.render("stats", page_date).result()
+    finally:
+        render_service.shutdown()
+
+    assert first_pdf != second_pdf
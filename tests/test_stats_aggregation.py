@@ -0,0 +1,76 @@
+from datetime import datetime, timedelta
+
+import numpy as np
+from nothion import PersonalStats
+
+from src.display_list import DisplayListDraw, LineOp
+from src.image_processor import _add_stat_sparkline_to_img
+from src.page_layout import get_page_layout
+from src.stats_aggregation import STAT_NAMES, aggregate_stats
+
+WORK_TIME = STAT_NAMES.index("work_time")
+
+
+def create_stats(start_date: datetime, work_times: list[float]) -> list[PersonalStats]:
+    return [PersonalStats(date=(start_date + timedelta(days=delta_days)).strftime("%Y-%m-%d"), work_time=work_time,
+                          leisure_time=0, focus_time=0)
+            for delta_days, work_time in enumerate(work_times)]
+
+
+def test_monthly_aggregation():
+    start_date, end_date = datetime(2024, 2, 1), datetime(2024, 2, 29)
+    work_times = [float(day_number % 7) for day_number in range(29)]
+    # The stats of the 10th are missing, and the stats of the next month are ignored
+    stats = [day_stats for day_stats in create_stats(start_date, work_times + [100.0])
+             if day_stats.date != "2024-02-10"]
+
+    summary = aggregate_stats(stats, start_date, end_date, rolling_days=7)
+    known_work_times = np.array(work_times[:9] + work_times[10:])
+
+    assert summary.daily_values.shape == (29, len(STAT_NAMES))
+    assert np.isnan(summary.daily_values[9, WORK_TIME])
+    assert summary.totals[WORK_TIME] == known_work_times.sum()
+    assert summary.means[WORK_TIME] == known_work_times.mean()
+    assert summary.rolling_means[6, WORK_TIME] == np.mean(work_times[:7])
+    # 2024-02-01 is a thursday, every thursday of the month has a work time of 0
+    assert summary.weekday_means[3, WORK_TIME] == 0
+    assert summary.longest_streaks[WORK_TIME] == 6
+    assert summary.current_streaks[WORK_TIME] == 0
+
+
+def test_yearly_aggregation():
+    start_date, end_date = datetime(2024, 1, 1), datetime(2024, 12, 31)
+    work_times = [0.0] * 100 + [2.0] * 200 + [0.0] * 16 + [4.0] * 50
+
+    summary = aggregate_stats(create_stats(start_date, work_times), start_date, end_date)
+
+    assert summary.daily_values.shape == (366, len(STAT_NAMES))
+    assert summary.totals[WORK_TIME] == 600
+    assert summary.means[WORK_TIME] == 600 / 366
+    assert summary.longest_streaks[WORK_TIME] == 200
+    assert summary.current_streaks[WORK_TIME] == 50
+    assert summary.longest_streaks[STAT_NAMES.index("sleep_time")] == 0
+
+
+def test_constant_sparkline_is_centered():
+    sparkline_layout = get_page_layout("stats_summary")["sparkline"]
+    raw_page = DisplayListDraw("template.png")
+
+    _add_stat_sparkline_to_img(raw_page, np.full(30, 3.0), (100, 200), 1000)
+
+    line_op = raw_page.display_list.ops[0]
+    assert isinstance(line_op, LineOp)
+    assert set(line_op.xy[1::2]) == {200 + sparkline_layout["height"] / 2}
+
+
+def test_monthly_and_yearly_pages_query_their_whole_range(page_processor, stub_notion_client):
+    queried_ranges = []
+    get_stats_between_dates = stub_notion_client.get_stats_between_dates
+    stub_notion_client.get_stats_between_dates = lambda start_date, end_date: (
+        queried_ranges.append((start_date.date(), end_date.date())) or get_stats_between_dates(start_date, end_date))
+
+    page_processor.generate_monthly_stats_page(datetime(2024, 2, 15), scale=0.1)
+    page_processor.generate_yearly_stats_page(datetime(2024, 2, 15), scale=0.1)
+
+    assert queried_ranges == [(datetime(2024, 2, 1).date(), datetime(2024, 2, 29).date()),
+                              (datetime(2024, 1, 1).date(), datetime(2024, 12, 31).date())]
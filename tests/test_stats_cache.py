@@ -0,0 +1,43 @@
+from datetime import datetime, timedelta
+
+from src.stats_cache import StatsCache
+
+CURRENT_DATE = datetime(2024, 5, 20)
+
+
+def test_prefetch_fetches_a_range_with_one_call(tmp_path, stub_notion_client):
+    notion_client = stub_notion_client
+    stats_cache = StatsCache(notion_client, str(tmp_path / "stats_cache.json"), CURRENT_DATE)
+
+    stats = stats_cache.get_stats_between_dates(CURRENT_DATE - timedelta(days=29), CURRENT_DATE)
+    stats_cache.get_day_stats(CURRENT_DATE - timedelta(days=10))
+
+    assert len(stats) == 30
+    assert notion_client.calls == 1
+
+
+def test_start_run_refetches_recent_stats(tmp_path, stub_notion_client):
+    notion_client = stub_notion_client
+    stats_cache = StatsCache(notion_client, str(tmp_path / "stats_cache.json"), CURRENT_DATE)
+    assert stats_cache.get_day_stats(CURRENT_DATE).work_time == 1.0
+
+    notion_client.work_time = 2.0
+    assert stats_cache.get_day_stats(CURRENT_DATE).work_time == 1.0
+
+    stats_cache.start_run(CURRENT_DATE)
+    assert stats_cache.get_day_stats(CURRENT_DATE).work_time == 2.0
+    assert notion_client.calls == 2
+
+
+def test_start_run_keeps_finalized_stats(tmp_path, stub_notion_client):
+    notion_client = stub_notion_client
+    cache_file = str(tmp_path / "stats_cache.json")
+    old_date = CURRENT_DATE - timedelta(days=10)
+    StatsCache(notion_client, cache_file, CURRENT_DATE).get_day_stats(old_date)
+
+    notion_client.work_time = 2.0
+    stats_cache = StatsCache(notion_client, cache_file, CURRENT_DATE)
+    stats_cache.start_run(CURRENT_DATE)
+
+    assert stats_cache.get_day_stats(old_date).work_time == 1.0
+    assert notion_client.calls == 1
@@ -0,0 +1,15 @@
+import logging
+
+from config import NEW_PAGES_FOLDER
+from src.cli_processor import get_pages_dates
+from src.page_processor import PageProcessor
+from src.page_watcher import PageWatcher
+
+logging.basicConfig(level=logging.INFO)
+
+day_date, week_start_date = get_pages_dates()
+
+page_watcher = PageWatcher(PageProcessor(), day_date,
+                           f"{NEW_PAGES_FOLDER}/bitacora-day-watch-{day_date.strftime('%d-%b-%Y').lower()}",
+                           week_start_date=week_start_date)
+page_watcher.watch()